@@ -0,0 +1,26 @@
+"""Read-only access to browser cookie databases."""
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+
+def read_cookie_db(db_path: Path, query: str) -> dict[str, str]:
+    """Run a name/value cookie query against a browser database without writing to it.
+
+    The database is opened read-only so no journal is created next to the browser's
+    file. If the running browser holds a lock, the file is re-read as immutable,
+    which skips locking at the cost of ignoring uncheckpointed WAL writes.
+    """
+    uri = db_path.resolve().as_uri()
+    try:
+        # Don't wait on the browser's lock; the immutable read below never blocks
+        return _query(f"{uri}?mode=ro", query, timeout=0)
+    except sqlite3.OperationalError:
+        return _query(f"{uri}?mode=ro&immutable=1", query)
+
+
+def _query(uri: str, query: str, timeout: float = 5.0) -> dict[str, str]:
+    """Open uri, run query, and close the connection even on error."""
+    with closing(sqlite3.connect(uri, uri=True, timeout=timeout)) as conn:
+        return dict(conn.execute(query))
@@ -1,22 +1,40 @@
 """Chrome cookie extraction for TweetHoarder."""
 
-import sqlite3
+from functools import cache
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from tweethoarder.auth.browser_db import read_cookie_db
+
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.ciphers import Cipher
 
 
 def extract_chrome_cookies(db_path: Path) -> dict[str, str]:
     """Extract auth_token, ct0, and twid cookies from Chrome Cookies DB."""
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.execute(
-            "SELECT name, value FROM cookies WHERE name IN ('auth_token', 'ct0', 'twid')"
-        )
-        cookies = {row[0]: row[1] for row in cursor.fetchall()}
-    return cookies
+    # Chrome's only cookie index leads with host_key, so restricting the host lets SQLite
+    # probe it instead of scanning every site's cookies. x.com rows sort last and win.
+    return read_cookie_db(
+        db_path,
+        "SELECT name, value FROM cookies"
+        " WHERE host_key IN ('.x.com', 'x.com', '.twitter.com', 'twitter.com')"
+        " AND name IN ('auth_token', 'ct0', 'twid')"
+        " ORDER BY host_key LIKE '%x.com'",
+    )
+
+
+@cache
+def _cipher_primitives() -> tuple[type["Cipher[Any]"], ModuleType, ModuleType]:
+    """Import the cryptography cipher classes once, on first decryption."""
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+    return Cipher, algorithms, modes
 
 
 def decrypt_chrome_cookie(encrypted_value: bytes, key: bytes) -> str:
     """Decrypt a Chrome cookie value using AES-128-CBC."""
-    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    Cipher, algorithms, modes = _cipher_primitives()
 
     if encrypted_value[:3] != b"v10":
         return ""
@@ -35,8 +53,27 @@ def decrypt_chrome_cookie(encrypted_value: bytes, key: bytes) -> str:
     return plaintext.decode("utf-8")
 
 
+# Chrome key derived from the keyring, kept once found; None means not looked up yet
+_cached_key: bytes | None = None
+
+
+def clear_chrome_key_cache() -> None:
+    """Forget the cached Chrome encryption key."""
+    global _cached_key
+    _cached_key = None
+
+
 def get_chrome_encryption_key() -> bytes | None:
-    """Get Chrome encryption key from GNOME keyring."""
+    """Get Chrome encryption key from GNOME keyring.
+
+    Fetching the key costs a D-Bus round-trip to the keyring, so a derived key is
+    cached for the process lifetime; use clear_chrome_key_cache() to reset. A missing
+    key is not cached, so a keyring that is locked or not yet filled in is asked again.
+    """
+    global _cached_key
+    if _cached_key is not None:
+        return _cached_key
+
     import secretstorage
     from cryptography.hazmat.primitives import hashes
     from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -58,7 +95,8 @@ def get_chrome_encryption_key() -> bytes | None:
         salt=b"saltysalt",
         iterations=1,
     )
-    return kdf.derive(password)
+    _cached_key = kdf.derive(password)
+    return _cached_key
 
 
 def find_chrome_cookies_db(home_dir: Path, profile: str | None = None) -> Path | None:
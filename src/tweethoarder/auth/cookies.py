@@ -2,10 +2,20 @@
 
 import os
 import tomllib
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
-from tweethoarder.auth.chrome import extract_chrome_cookies, find_chrome_cookies_db
-from tweethoarder.auth.firefox import extract_firefox_cookies, find_firefox_cookies_db
+from tweethoarder.auth.chrome import (
+    clear_chrome_key_cache,
+    extract_chrome_cookies,
+    find_chrome_cookies_db,
+)
+from tweethoarder.auth.firefox import (
+    clear_firefox_profile_cache,
+    extract_firefox_cookies,
+    find_firefox_cookies_db,
+)
 from tweethoarder.config import get_config_dir
 
 
@@ -13,6 +23,17 @@ class CookieError(Exception):
     """Raised when cookie resolution fails."""
 
 
+def _load_toml(path: Path) -> dict[str, Any]:
+    """Parse a TOML file, preferring the Rust-backed rtoml parser when installed."""
+    try:
+        import rtoml
+    except ImportError:
+        with path.open("rb") as f:
+            return tomllib.load(f)
+    data: dict[str, Any] = rtoml.load(path)
+    return data
+
+
 def resolve_cookies(home_dir: Path | None = None) -> dict[str, str]:
     """Resolve cookies using priority-based fallback chain."""
     auth_token = os.environ.get("TWITTER_AUTH_TOKEN")
@@ -25,10 +46,28 @@ def resolve_cookies(home_dir: Path | None = None) -> dict[str, str]:
             result["twid"] = twid
         return result
 
+    if home_dir is None:
+        home_dir = Path.home()
     config_path = get_config_dir() / "config.toml"
+    return dict(_resolve_stored_cookies(config_path, home_dir))
+
+
+def clear_cookie_cache() -> None:
+    """Forget cookies resolved from the config file or browsers, and the Chrome key."""
+    _resolve_stored_cookies.cache_clear()
+    clear_firefox_profile_cache()
+    clear_chrome_key_cache()
+
+
+@lru_cache(maxsize=4)
+def _resolve_stored_cookies(config_path: Path, home_dir: Path) -> tuple[tuple[str, str], ...]:
+    """Resolve cookies from the config file, then Firefox, then Chrome.
+
+    The result is cached for the process lifetime because every source involves
+    disk I/O. It is returned as a tuple of items so the cached value can't be mutated.
+    """
     if config_path.exists():
-        with config_path.open("rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(config_path)
         auth_data = data.get("auth", {})
         auth_token = auth_data.get("auth_token")
         ct0 = auth_data.get("ct0")
@@ -37,10 +76,8 @@ def resolve_cookies(home_dir: Path | None = None) -> dict[str, str]:
             result = {"auth_token": auth_token, "ct0": ct0}
             if twid:
                 result["twid"] = twid
-            return result
+            return tuple(result.items())
 
-    if home_dir is None:
-        home_dir = Path.home()
     firefox_db = find_firefox_cookies_db(home_dir)
     if firefox_db:
         cookies = extract_firefox_cookies(firefox_db)
@@ -50,7 +87,7 @@ def resolve_cookies(home_dir: Path | None = None) -> dict[str, str]:
             result = {"auth_token": auth_token, "ct0": ct0}
             if "twid" in cookies:
                 result["twid"] = cookies["twid"]
-            return result
+            return tuple(result.items())
 
     chrome_db = find_chrome_cookies_db(home_dir)
     if chrome_db:
@@ -61,6 +98,6 @@ def resolve_cookies(home_dir: Path | None = None) -> dict[str, str]:
             result = {"auth_token": auth_token, "ct0": ct0}
             if "twid" in cookies:
                 result["twid"] = cookies["twid"]
-            return result
+            return tuple(result.items())
 
     raise CookieError("No Twitter cookies found")
@@ -1,17 +1,17 @@
 """Firefox cookie extraction for TweetHoarder."""
 
-import sqlite3
+import os
+from functools import lru_cache
 from pathlib import Path
 
+from tweethoarder.auth.browser_db import read_cookie_db
+
 
 def extract_firefox_cookies(db_path: Path) -> dict[str, str]:
     """Extract auth_token, ct0, and twid cookies from Firefox cookies.sqlite."""
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.execute(
-            "SELECT name, value FROM moz_cookies WHERE name IN ('auth_token', 'ct0', 'twid')"
-        )
-        cookies = {row[0]: row[1] for row in cursor.fetchall()}
-    return cookies
+    return read_cookie_db(
+        db_path, "SELECT name, value FROM moz_cookies WHERE name IN ('auth_token', 'ct0', 'twid')"
+    )
 
 
 FIREFOX_COOKIE_PATHS = [
@@ -22,14 +22,42 @@ FIREFOX_COOKIE_PATHS = [
 
 def find_firefox_cookies_db(home_dir: Path) -> Path | None:
     """Find the most recently modified Firefox cookies.sqlite file."""
+    newest: Path | None = None
+    newest_mtime = 0.0
+    for candidate in _find_firefox_cookie_candidates(home_dir):
+        try:
+            mtime = candidate.stat().st_mtime
+        except OSError:
+            continue
+        if newest is None or mtime > newest_mtime:
+            newest, newest_mtime = candidate, mtime
+    return newest
+
+
+def clear_firefox_profile_cache() -> None:
+    """Forget the cached Firefox profile directory listings."""
+    _find_firefox_cookie_candidates.cache_clear()
+
+
+@lru_cache(maxsize=4)
+def _find_firefox_cookie_candidates(home_dir: Path) -> tuple[Path, ...]:
+    """List the cookies.sqlite path of every Firefox profile directory.
+
+    os.scandir reports whether each entry is a directory from the directory listing
+    itself, so no per-profile stat is needed here; find_firefox_cookies_db stats each
+    cookies.sqlite exactly once and skips profiles that don't have one or can't be read.
+    The listing is cached per home_dir.
+    """
     candidates: list[Path] = []
-
     for base_path in FIREFOX_COOKIE_PATHS:
         firefox_dir = home_dir / base_path
-        if firefox_dir.exists():
-            candidates.extend(firefox_dir.glob("*/cookies.sqlite"))
-
-    if not candidates:
-        return None
-
-    return max(candidates, key=lambda p: p.stat().st_mtime)
+        try:
+            entries = os.scandir(firefox_dir)
+        except OSError:
+            # Missing or unreadable directories are skipped, as Path.glob did
+            continue
+        with entries:
+            candidates.extend(
+                Path(entry.path) / "cookies.sqlite" for entry in entries if entry.is_dir()
+            )
+    return tuple(candidates)
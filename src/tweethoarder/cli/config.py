@@ -2,6 +2,7 @@
 
 import typer
 
+from tweethoarder.auth.cookies import clear_cookie_cache
 from tweethoarder.config import get_config_dir
 
 app = typer.Typer(
@@ -27,3 +28,4 @@ def set(
     config_dir.mkdir(parents=True, exist_ok=True)
     config_file = config_dir / "config.toml"
     config_file.write_text(f"{key} = {value}\n")
+    clear_cookie_cache()
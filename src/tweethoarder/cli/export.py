@@ -1,10 +1,16 @@
 """Export commands for TweetHoarder CLI."""
 
+from collections.abc import Iterable, Iterator, Mapping
+from io import BufferedIOBase, BufferedWriter, FileIO
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, TextIO
 
 import typer
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
 app = typer.Typer(
     name="export",
     help="Export synced data to various formats.",
@@ -16,7 +22,7 @@ def json(
     collection: str | None = typer.Option(
         None,
         "--collection",
-        help="Filter by collection type (likes, bookmarks, tweets, reposts, replies, posts).",
+        help="Filter by collection type (likes, bookmarks, tweets, reposts, replies, posts, all).",
     ),
     folder: str | None = typer.Option(
         None,
@@ -28,62 +34,187 @@ def json(
         "--output",
         help="Output file path.",
     ),
+    compress: bool = typer.Option(
+        False,
+        "--gzip",
+        help="Compress the output with gzip (adds .gz to the default file name).",
+    ),
+    ndjson: bool = typer.Option(
+        False,
+        "--ndjson",
+        help="Write one JSON object per line (NDJSON) instead of a single document.",
+    ),
 ) -> None:
     """Export tweets to JSON format."""
-    import json as json_lib
-
     from tweethoarder.config import get_data_dir
-    from tweethoarder.export.json_export import export_tweets_to_json
-    from tweethoarder.storage.database import (
-        get_all_tweets,
-        get_tweets_by_bookmark_folder,
-        get_tweets_by_collection,
-        get_tweets_by_collections,
-    )
+    from tweethoarder.export.json_export import export_tweets_to_json, iter_formatted_tweets
+    from tweethoarder.storage.database import open_db
 
     data_dir = get_data_dir()
     db_path = data_dir / "tweethoarder.db"
-    collection_type = COLLECTION_MAP.get(collection, collection) if collection else None
 
-    tweets: list[dict[str, Any]]
-    if folder and collection_type == "bookmark":
-        tweets = get_tweets_by_bookmark_folder(db_path, folder)
-    elif isinstance(collection_type, list):
-        # Combined collection (e.g., "posts" = tweets + replies + reposts)
-        tweets = get_tweets_by_collections(db_path, collection_type)
-    elif collection_type:
-        tweets = get_tweets_by_collection(db_path, collection_type)
-    else:
-        tweets = get_all_tweets(db_path)
+    with open_db(db_path):
+        tweets = _load_tweets(db_path, collection, folder)
 
-    result = export_tweets_to_json(tweets, collection=collection)
-    content = json_lib.dumps(result, indent=2, ensure_ascii=False)
+    if ndjson:
+        output_path = output or _get_default_export_path(
+            data_dir, collection, "ndjson.gz" if compress else "ndjson"
+        )
+        _write_ndjson(output_path, iter_formatted_tweets(tweets), compress)
+        return
 
-    output_path = output or _get_default_export_path(data_dir, collection, "json")
-    output_path.write_text(content)
+    result = export_tweets_to_json(tweets, collection=collection, stream=True)
 
-
-def _get_default_export_path(data_dir: Path, collection: str | None, fmt: str) -> Path:
-    """Generate default export path with timestamp."""
+    output_path = output or _get_default_export_path(
+        data_dir, collection, "json.gz" if compress else "json"
+    )
+    _write_json(output_path, result, compress)
+
+
+def _get_default_export_path(
+    data_dir: Path,
+    collection: str | None,
+    fmt: str,
+    timestamp: "datetime | None" = None,
+    exports_dir: Path | None = None,
+) -> Path:
+    """Generate default export path with timestamp.
+
+    Args:
+        data_dir: Data directory whose exports/ subdirectory holds the file.
+        collection: Exported collection, named in the file name ("all" if None).
+        fmt: File extension, e.g. "json" or "html.gz".
+        timestamp: Time to stamp the file name with (default: now), so several
+            exports can share one.
+        exports_dir: Directory to write to instead of the data directory's exports/.
+
+    Returns:
+        The export file path; its directory is created if missing.
+    """
     from datetime import UTC, datetime
 
-    exports_dir = data_dir / "exports"
+    exports_dir = exports_dir or data_dir / "exports"
     exports_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
-    filename = f"{collection or 'all'}_{timestamp}.{fmt}"
+    stamp = (timestamp or datetime.now(UTC)).strftime("%Y%m%dT%H%M%S")
+    filename = f"{collection or 'all'}_{stamp}.{fmt}"
     return exports_dir / filename
 
 
-# Map from CLI plural names to database singular names
-COLLECTION_MAP = {
-    "likes": "like",
-    "bookmarks": "bookmark",
-    "tweets": "tweet",
-    "reposts": "repost",
-    "replies": "reply",
-    "posts": ["tweet", "repost"],  # Combined collection (replies not available via API)
-    "all": "all",  # Export all tweets with collection types
-}
+def _load_tweets(db_path: Path, collection: str | None, folder: str | None) -> list[dict[str, Any]]:
+    """Load the tweets selected by the --collection and --folder export options.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        collection: CLI collection name (e.g. "likes", "posts", "all"), or None for every tweet.
+        folder: Bookmark folder name; only applies to the bookmarks collection.
+
+    Returns:
+        List of tweet dictionaries in the collection's display order.
+    """
+    from tweethoarder.storage.database import (
+        get_all_tweets,
+        get_all_tweets_with_collection_types,
+        get_tweets_by_bookmark_folder,
+        get_tweets_by_collection,
+        get_tweets_by_collections,
+    )
+
+    collection_type = COLLECTION_MAP.get(collection, collection) if collection else None
+    if collection_type == "all":
+        return get_all_tweets_with_collection_types(db_path)
+    if folder and collection_type == "bookmark":
+        return get_tweets_by_bookmark_folder(db_path, folder)
+    if isinstance(collection_type, tuple):
+        # Combined collection (e.g., "posts" = tweets + reposts)
+        return get_tweets_by_collections(db_path, collection_type)
+    if collection_type:
+        return get_tweets_by_collection(db_path, collection_type)
+    return get_all_tweets(db_path)
+
+
+def _open_export(path: Path, compress: bool, newline: str | None = None) -> TextIO:
+    """Open a UTF-8 export file for writing, gzip-compressing it when compress is set.
+
+    Uncompressed files get a 1 MiB buffer. Compressed files use the fastest gzip level,
+    which already shrinks the repetitive JSON and Markdown text several times over.
+    """
+    if compress:
+        import gzip
+
+        return gzip.open(path, "wt", compresslevel=1, encoding="utf-8", newline=newline)
+    return path.open("w", buffering=EXPORT_BUFFER_SIZE, encoding="utf-8", newline=newline)
+
+
+def _open_export_binary(path: Path, compress: bool) -> BufferedIOBase:
+    """Open an export file for writing bytes, gzip-compressing it when compress is set."""
+    if compress:
+        import gzip
+
+        return gzip.open(path, "wb", compresslevel=1)
+    return BufferedWriter(FileIO(path, "w"), buffer_size=EXPORT_BUFFER_SIZE)
+
+
+def _write_json(path: Path, obj: dict[str, Any], compress: bool = False) -> None:
+    """Write obj as 2-space indented UTF-8 JSON, one top-level value at a time.
+
+    Iterator values (such as the formatted tweets) are encoded element by element, so
+    neither the full list nor the full document is held in memory. The output is the
+    same as encoding the fully built object with indent=2.
+    """
+    from tweethoarder.export.json_export import dumps_compact, dumps_indented
+
+    with _open_export_binary(path, compress) as fh:
+        fh.write(b"{")
+        for i, (key, value) in enumerate(obj.items()):
+            fh.write(b",\n  " if i else b"\n  ")
+            fh.write(dumps_compact(key))
+            fh.write(b": ")
+            if not isinstance(value, Iterator):
+                fh.write(dumps_indented(value).replace(b"\n", b"\n  "))
+                continue
+            # JSON strings cannot contain raw newlines, so re-indenting on b"\n" is safe
+            empty = True
+            fh.write(b"[")
+            for item in value:
+                fh.write(b"\n    " if empty else b",\n    ")
+                fh.write(dumps_indented(item).replace(b"\n", b"\n    "))
+                empty = False
+            fh.write(b"]" if empty else b"\n  ]")
+        fh.write(b"\n}" if obj else b"}")
+
+
+def _write_ndjson(path: Path, rows: Iterable[Any], compress: bool = False) -> None:
+    """Write each row as one compact JSON line, encoding rows as they are consumed."""
+    try:
+        import orjson
+    except ImportError:
+        import json as json_lib
+
+        with _open_export(path, compress) as fh:
+            for row in rows:
+                fh.write(json_lib.dumps(row, ensure_ascii=False, separators=(",", ":")))
+                fh.write("\n")
+        return
+    with _open_export_binary(path, compress) as fh:
+        for row in rows:
+            fh.write(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS))
+
+
+# Export files are written through a 1 MiB buffer so large exports need few write() calls
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Map from CLI plural names to database singular names (read-only, built once at import)
+COLLECTION_MAP: Mapping[str, str | tuple[str, ...]] = MappingProxyType(
+    {
+        "likes": "like",
+        "bookmarks": "bookmark",
+        "tweets": "tweet",
+        "reposts": "repost",
+        "replies": "reply",
+        "posts": ("tweet", "repost"),  # Combined collection (replies not available via API)
+        "all": "all",  # Export all tweets with collection types
+    }
+)
 
 
 @app.command()
@@ -91,7 +222,7 @@ def markdown(
     collection: str | None = typer.Option(
         None,
         "--collection",
-        help="Filter by collection type (likes, bookmarks, tweets, reposts, replies, posts).",
+        help="Filter by collection type (likes, bookmarks, tweets, reposts, replies, posts, all).",
     ),
     folder: str | None = typer.Option(
         None,
@@ -103,76 +234,70 @@ def markdown(
         "--output",
         help="Output file path.",
     ),
+    compress: bool = typer.Option(
+        False,
+        "--gzip",
+        help="Compress the output with gzip (adds .gz to the default file name).",
+    ),
 ) -> None:
     """Export tweets to Markdown format."""
     from tweethoarder.config import get_data_dir
-    from tweethoarder.export.markdown_export import export_tweets_to_markdown
+    from tweethoarder.export.markdown_export import write_tweets_markdown
     from tweethoarder.storage.database import (
-        get_all_tweets,
-        get_tweets_by_bookmark_folder,
-        get_tweets_by_collection,
-        get_tweets_by_collections,
-        get_tweets_by_conversation_id,
+        get_tweets_by_conversation_ids,
         get_tweets_by_ids,
+        open_db,
     )
 
     data_dir = get_data_dir()
     db_path = data_dir / "tweethoarder.db"
-    collection_type = COLLECTION_MAP.get(collection, collection) if collection else None
 
-    tweets: list[dict[str, Any]]
-    if folder and collection_type == "bookmark":
-        tweets = get_tweets_by_bookmark_folder(db_path, folder)
-    elif isinstance(collection_type, list):
-        tweets = get_tweets_by_collections(db_path, collection_type)
-    elif collection_type:
-        tweets = get_tweets_by_collection(db_path, collection_type)
-    else:
-        tweets = get_all_tweets(db_path)
+    with open_db(db_path):
+        tweets = _load_tweets(db_path, collection, folder)
 
-    # Build thread context for tweets with conversation_id
-    thread_context: dict[str, list[dict[str, Any]]] = {}
-    for tweet in tweets:
-        conv_id = tweet.get("conversation_id")
-        if conv_id and conv_id not in thread_context:
-            try:
-                thread_context[conv_id] = get_tweets_by_conversation_id(db_path, conv_id)
-            except Exception:
-                thread_context[conv_id] = []
-
-    # Collect quoted tweet IDs and fetch them
-    tweet_ids_in_collection = {t["id"] for t in tweets}
-    quoted_tweet_ids = [
-        t["quoted_tweet_id"]
-        for t in tweets
-        if t.get("quoted_tweet_id") and t["quoted_tweet_id"] not in tweet_ids_in_collection
-    ]
-    quoted_tweets_list = get_tweets_by_ids(db_path, quoted_tweet_ids)
-    quoted_tweets = {t["id"]: t for t in quoted_tweets_list}
-    # Also add quoted tweets that are already in our collection
-    for t in tweets:
-        quoted_tweets[t["id"]] = t
-
-    # Collect parent tweet IDs for replies and fetch them
-    parent_tweet_ids = [
-        t["in_reply_to_tweet_id"]
-        for t in tweets
-        if t.get("in_reply_to_tweet_id")
-        and t["in_reply_to_tweet_id"] not in tweet_ids_in_collection
-    ]
-    parent_tweets_list = get_tweets_by_ids(db_path, parent_tweet_ids)
-    parent_tweets = {t["id"]: t for t in parent_tweets_list}
-
-    content = export_tweets_to_markdown(
-        tweets,
-        collection=collection,
-        thread_context=thread_context,
-        quoted_tweets=quoted_tweets,
-        parent_tweets=parent_tweets,
+        # Build thread context for tweets with conversation_id
+        conv_ids = list(
+            dict.fromkeys(t["conversation_id"] for t in tweets if t.get("conversation_id"))
+        )
+        try:
+            conversations = get_tweets_by_conversation_ids(db_path, conv_ids)
+        except Exception:
+            conversations = {}
+        thread_context = {conv_id: conversations.get(conv_id, []) for conv_id in conv_ids}
+
+        # Collect quoted tweet IDs and parent tweet IDs of replies in one pass,
+        # deduplicated in first-seen order (dicts used as ordered sets)
+        tweet_by_id = {t["id"]: t for t in tweets}
+        quoted_tweet_ids: dict[str, None] = {}
+        parent_tweet_ids: dict[str, None] = {}
+        for t in tweets:
+            quoted_id = t.get("quoted_tweet_id")
+            if quoted_id and quoted_id not in tweet_by_id:
+                quoted_tweet_ids[quoted_id] = None
+            parent_id = t.get("in_reply_to_tweet_id")
+            if parent_id and parent_id not in tweet_by_id:
+                parent_tweet_ids[parent_id] = None
+
+        quoted_tweets_list = get_tweets_by_ids(db_path, list(quoted_tweet_ids))
+        quoted_tweets = {t["id"]: t for t in quoted_tweets_list}
+        # Also add quoted tweets that are already in our collection
+        quoted_tweets.update(tweet_by_id)
+
+        parent_tweets_list = get_tweets_by_ids(db_path, list(parent_tweet_ids))
+        parent_tweets = {t["id"]: t for t in parent_tweets_list}
+
+    output_path = output or _get_default_export_path(
+        data_dir, collection, "md.gz" if compress else "md"
     )
-
-    output_path = output or _get_default_export_path(data_dir, collection, "md")
-    output_path.write_text(content)
+    with _open_export(output_path, compress) as fh:
+        write_tweets_markdown(
+            tweets,
+            fh,
+            collection=collection,
+            thread_context=thread_context,
+            quoted_tweets=quoted_tweets,
+            parent_tweets=parent_tweets,
+        )
 
 
 @app.command()
@@ -180,7 +305,7 @@ def csv(
     collection: str | None = typer.Option(
         None,
         "--collection",
-        help="Filter by collection type (likes, bookmarks, tweets, reposts, replies, posts).",
+        help="Filter by collection type (likes, bookmarks, tweets, reposts, replies, posts, all).",
     ),
     folder: str | None = typer.Option(
         None,
@@ -192,35 +317,28 @@ def csv(
         "--output",
         help="Output file path.",
     ),
+    compress: bool = typer.Option(
+        False,
+        "--gzip",
+        help="Compress the output with gzip (adds .gz to the default file name).",
+    ),
 ) -> None:
     """Export tweets to CSV format."""
     from tweethoarder.config import get_data_dir
-    from tweethoarder.export.csv_export import export_tweets_to_csv
-    from tweethoarder.storage.database import (
-        get_all_tweets,
-        get_tweets_by_bookmark_folder,
-        get_tweets_by_collection,
-        get_tweets_by_collections,
-    )
+    from tweethoarder.export.csv_export import write_tweets_csv
+    from tweethoarder.storage.database import open_db
 
     data_dir = get_data_dir()
     db_path = data_dir / "tweethoarder.db"
-    collection_type = COLLECTION_MAP.get(collection, collection) if collection else None
 
-    tweets: list[dict[str, Any]]
-    if folder and collection_type == "bookmark":
-        tweets = get_tweets_by_bookmark_folder(db_path, folder)
-    elif isinstance(collection_type, list):
-        tweets = get_tweets_by_collections(db_path, collection_type)
-    elif collection_type:
-        tweets = get_tweets_by_collection(db_path, collection_type)
-    else:
-        tweets = get_all_tweets(db_path)
-
-    content = export_tweets_to_csv(tweets)
+    with open_db(db_path):
+        tweets = _load_tweets(db_path, collection, folder)
 
-    output_path = output or _get_default_export_path(data_dir, collection, "csv")
-    output_path.write_text(content)
+    output_path = output or _get_default_export_path(
+        data_dir, collection, "csv.gz" if compress else "csv"
+    )
+    with _open_export(output_path, compress, newline="") as fh:
+        write_tweets_csv(tweets, fh)
 
 
 @app.command()
@@ -240,95 +358,71 @@ def html(
         "--output",
         help="Output file path.",
     ),
+    compress: bool = typer.Option(
+        False,
+        "--gzip",
+        help="Compress the output with gzip (adds .gz to the default file name).",
+    ),
 ) -> None:
     """Export tweets to HTML format."""
     from tweethoarder.config import get_data_dir
     from tweethoarder.storage.database import (
-        get_all_tweets,
-        get_all_tweets_with_collection_types,
-        get_tweets_by_bookmark_folder,
-        get_tweets_by_collection,
-        get_tweets_by_collections,
-        get_tweets_by_conversation_id,
+        get_tweets_by_conversation_ids,
         get_tweets_by_ids,
+        open_db,
     )
 
     data_dir = get_data_dir()
     db_path = data_dir / "tweethoarder.db"
-    collection_type = COLLECTION_MAP.get(collection, collection) if collection else None
-
-    tweets: list[dict[str, Any]]
-    if collection_type == "all":
-        tweets = get_all_tweets_with_collection_types(db_path)
-    elif folder and collection_type == "bookmark":
-        tweets = get_tweets_by_bookmark_folder(db_path, folder)
-    elif isinstance(collection_type, list):
-        tweets = get_tweets_by_collections(db_path, collection_type)
-    elif collection_type:
-        tweets = get_tweets_by_collection(db_path, collection_type)
-    else:
-        tweets = get_all_tweets(db_path)
 
-    # Build thread context for tweets with conversation_id
-    thread_context: dict[str, list[dict[str, Any]]] = {}
-    for tweet in tweets:
-        conv_id = tweet.get("conversation_id")
-        if conv_id and conv_id not in thread_context:
-            try:
-                thread_context[conv_id] = get_tweets_by_conversation_id(db_path, conv_id)
-            except Exception:
-                thread_context[conv_id] = []
-
-    # Collect quoted tweet IDs that aren't already in our collection
-    tweet_ids_in_collection = {t["id"] for t in tweets}
-    quoted_tweet_ids = [
-        t["quoted_tweet_id"]
-        for t in tweets
-        if t.get("quoted_tweet_id") and t["quoted_tweet_id"] not in tweet_ids_in_collection
-    ]
-    # Fetch quoted tweets from database
-    quoted_tweets = get_tweets_by_ids(db_path, quoted_tweet_ids)
-
-    import json
-    from collections import Counter
-
-    from tweethoarder.export.richtext import extract_richtext_tags
-
-    def extract_retweeter_username(raw_json: str | None) -> str | None:
-        """Extract retweeter username from raw_json for retweets."""
-        if not raw_json:
-            return None
+    with open_db(db_path):
+        tweets = _load_tweets(db_path, collection, folder)
+
+        # Collect conversation IDs and quoted tweet IDs that aren't already in our
+        # collection in one pass, deduplicated in first-seen order (dicts used as
+        # ordered sets); the id index is reused below for merging reposts
+        tweet_by_id = {t["id"]: t for t in tweets}
+        conv_ids: dict[str, None] = {}
+        quoted_tweet_ids: dict[str, None] = {}
+        for t in tweets:
+            conv_id = t.get("conversation_id")
+            if conv_id:
+                conv_ids[conv_id] = None
+            quoted_id = t.get("quoted_tweet_id")
+            if quoted_id and quoted_id not in tweet_by_id:
+                quoted_tweet_ids[quoted_id] = None
+
+        # Build thread context for tweets with conversation_id
         try:
-            raw = json.loads(raw_json)
-            # Check if this is a retweet
-            if not raw.get("legacy", {}).get("retweeted_status_result"):
-                return None
-            # The retweeter is the user in core.user_results
-            user_result = raw.get("core", {}).get("user_results", {}).get("result", {})
-            screen_name: str | None = user_result.get("legacy", {}).get(
-                "screen_name"
-            ) or user_result.get("core", {}).get("screen_name")
-            return screen_name
-        except (json.JSONDecodeError, TypeError):
+            conversations = get_tweets_by_conversation_ids(db_path, list(conv_ids))
+        except Exception:
+            conversations = {}
+        thread_context = {conv_id: conversations.get(conv_id, []) for conv_id in conv_ids}
+
+        # Fetch quoted tweets from database
+        quoted_tweets = get_tweets_by_ids(db_path, list(quoted_tweet_ids))
+
+    from tweethoarder.export.html_export import write_tweets_html
+    from tweethoarder.export.json_export import JSONDecodeError, loads_json
+    from tweethoarder.export.richtext import extract_richtext_tags, richtext_tags_from_raw
+
+    def extract_retweeter_username(raw: dict[str, Any]) -> str | None:
+        """Extract retweeter username from parsed raw_json for retweets."""
+        # Check if this is a retweet
+        if not raw.get("legacy", {}).get("retweeted_status_result"):
             return None
-
-    # Extract richtext_tags and retweeter_username from raw_json for each tweet
-    for tweet in tweets:
-        richtext_tags = extract_richtext_tags(tweet.get("raw_json"))
-        if richtext_tags:
-            tweet["richtext_tags"] = richtext_tags
-        retweeter = extract_retweeter_username(tweet.get("raw_json"))
-        if retweeter:
-            tweet["retweeter_username"] = retweeter
-    for tweet in quoted_tweets:
-        richtext_tags = extract_richtext_tags(tweet.get("raw_json"))
-        if richtext_tags:
-            tweet["richtext_tags"] = richtext_tags
+        # The retweeter is the user in core.user_results
+        user_result = raw.get("core", {}).get("user_results", {}).get("result", {})
+        screen_name: str | None = user_result.get("legacy", {}).get(
+            "screen_name"
+        ) or user_result.get("core", {}).get("screen_name")
+        return screen_name
 
     # Deduplicate: merge repost entries with their original tweets if both exist
     # When we have both a repost (is_retweet=True, retweeted_tweet_id=X) and
-    # the original tweet (id=X) in our collection, merge them into one entry
-    tweet_by_id = {t["id"]: t for t in tweets}
+    # the original tweet (id=X) in our collection, merge them into one entry.
+    # The same pass extracts richtext_tags and retweeter_username from raw_json,
+    # parsing each (potentially large) payload only once
     repost_ids_to_remove: set[str] = set()
 
     for tweet in tweets:
@@ -339,18 +433,35 @@ def html(
                 original_tweet = tweet_by_id[original_id]
                 repost_types = tweet.get("collection_types", [])
                 original_types = original_tweet.get("collection_types", [])
-                # Merge collection types (avoiding duplicates)
-                merged_types = list(original_types)
-                for ct in repost_types:
-                    if ct not in merged_types:
-                        merged_types.append(ct)
-                original_tweet["collection_types"] = merged_types
+                # Merge collection types, dropping duplicates but keeping their order
+                original_tweet["collection_types"] = list(
+                    dict.fromkeys([*original_types, *repost_types])
+                )
                 # Mark this repost entry for removal
                 repost_ids_to_remove.add(tweet["id"])
 
-    # Remove merged repost entries
-    if repost_ids_to_remove:
-        tweets = [t for t in tweets if t["id"] not in repost_ids_to_remove]
+        raw_json = tweet.get("raw_json")
+        if not raw_json:
+            continue
+        try:
+            raw = loads_json(raw_json)
+        except (JSONDecodeError, TypeError):
+            continue
+        if not isinstance(raw, dict):
+            continue
+        richtext_tags = richtext_tags_from_raw(raw)
+        if richtext_tags:
+            tweet["richtext_tags"] = richtext_tags
+        try:
+            retweeter = extract_retweeter_username(raw)
+        except (TypeError, AttributeError):
+            retweeter = None
+        if retweeter:
+            tweet["retweeter_username"] = retweeter
+    for tweet in quoted_tweets:
+        richtext_tags = extract_richtext_tags(tweet.get("raw_json"))
+        if richtext_tags:
+            tweet["richtext_tags"] = richtext_tags
 
     # Deduplicate tweets from the same thread (same conversation_id)
     # Only deduplicate self-reply threads (where author replies to themselves)
@@ -366,6 +477,9 @@ def html(
     deduplicated_tweets: list[dict[str, Any]] = []
 
     for tweet in tweets:
+        # Merged repost entries are dropped here rather than in a separate pass
+        if tweet["id"] in repost_ids_to_remove:
+            continue
         conv_id = tweet.get("conversation_id")
         # Only deduplicate if this is part of a self-reply thread
         is_thread_tweet = is_self_reply_thread_tweet(tweet)
@@ -374,10 +488,9 @@ def html(
             seen_conversations[conv_id]["highlighted_tweet_ids"].append(tweet["id"])
             # Merge collection_types
             existing_types = seen_conversations[conv_id].get("collection_types", [])
-            for ct in tweet.get("collection_types", []):
-                if ct not in existing_types:
-                    existing_types.append(ct)
-            seen_conversations[conv_id]["collection_types"] = existing_types
+            seen_conversations[conv_id]["collection_types"] = list(
+                dict.fromkeys([*existing_types, *tweet.get("collection_types", [])])
+            )
         else:
             # New thread, standalone tweet, or reply to someone else's comment
             tweet["highlighted_tweet_ids"] = [tweet["id"]]
@@ -387,950 +500,81 @@ def html(
 
     tweets = deduplicated_tweets
 
-    # Strip unused fields to reduce HTML size
-    used_fields = {
-        "id",
-        "text",
-        "author_id",
-        "author_username",
-        "author_display_name",
-        "reply_count",
-        "retweet_count",
-        "like_count",
-        "quote_count",
-        "author_avatar_url",
-        "created_at",
-        "conversation_id",
-        "in_reply_to_tweet_id",
-        "in_reply_to_user_id",
-        "urls_json",
-        "media_json",
-        "is_retweet",
-        "retweeter_username",
-        "quoted_tweet_id",
-        "richtext_tags",
-        "collection_types",
-        "highlighted_tweet_ids",
-    }
-    stripped_tweets = [{k: v for k, v in t.items() if k in used_fields} for t in tweets]
-    # Include quoted tweets separately for TWEETS_MAP lookup only
-    stripped_quoted = [{k: v for k, v in t.items() if k in used_fields} for t in quoted_tweets]
-    tweets_json = json.dumps(stripped_tweets)
-    quoted_tweets_json = json.dumps(stripped_quoted)
-
-    # Compute facets
-    author_data: dict[str, dict[str, str | int]] = {}
-    month_counts: Counter[str] = Counter()
-    media_counts = {"photo": 0, "video": 0, "link": 0, "text_only": 0}
-    type_counts: Counter[str] = Counter()
+    output_path = output or _get_default_export_path(
+        data_dir, collection, "html.gz" if compress else "html"
+    )
+    with _open_export_binary(output_path, compress) as fh:
+        write_tweets_html(fh, tweets, quoted_tweets, thread_context)
 
-    for tweet in tweets:
-        username = tweet.get("author_username", "unknown")
-        if username not in author_data:
-            author_data[username] = {
-                "username": username,
-                "display_name": tweet.get("author_display_name", username),
-                "count": 0,
-            }
-        author_data[username]["count"] = int(author_data[username]["count"]) + 1
-
-        created_at = tweet.get("created_at", "")
-        if created_at and len(created_at) >= 7:
-            month = created_at[:7]  # YYYY-MM
-            month_counts[month] += 1
-
-        media_json = tweet.get("media_json")
-        urls_json = tweet.get("urls_json")
-        has_media = False
-
-        if media_json:
-            has_media = True
-            if "video" in str(media_json).lower():
-                media_counts["video"] += 1
-            else:
-                media_counts["photo"] += 1
-        elif urls_json:
-            has_media = True
-            media_counts["link"] += 1
-        if not has_media:
-            media_counts["text_only"] += 1
-
-        # Count collection types
-        collection_types = tweet.get("collection_types", [])
-        for ct in collection_types:
-            type_counts[ct] += 1
-
-    facets = {
-        "authors": sorted(author_data.values(), key=lambda x: -int(x["count"])),
-        "months": [{"month": m, "count": c} for m, c in sorted(month_counts.items())],
-        "media": media_counts,
-        "types": dict(type_counts),
-    }
-    facets_json = json.dumps(facets)
-    # Extract richtext_tags for thread context tweets
-    for thread_tweets in thread_context.values():
-        for tweet in thread_tweets:
-            richtext_tags = extract_richtext_tags(tweet.get("raw_json"))
-            if richtext_tags:
-                tweet["richtext_tags"] = richtext_tags
-    # Strip unused fields from thread context too
-    stripped_thread_context = {
-        conv_id: [{k: v for k, v in t.items() if k in used_fields} for t in thread_tweets]
-        for conv_id, thread_tweets in thread_context.items()
-    }
-    thread_context_json = json.dumps(stripped_thread_context)
-
-    lines = [
-        "<!DOCTYPE html>",
-        "<html>",
-        "<head>",
-        '<meta charset="utf-8">',
-        # DOMPurify for safe HTML sanitization
-        '<script src="https://cdnjs.cloudflare.com/ajax/libs/dompurify/3.0.6/purify.min.js"'
-        ' integrity="sha512-H+rglffZ6f5gF7UJgvH4Naa+fGCgjrHKMgoFOGmcPjXeDNcgKOj'
-        'pIDK/RbAHbU2HcwrugFrHPkpJNZpyT1eQzQ=="'
-        ' crossorigin="anonymous" referrerpolicy="no-referrer"></script>',
-        "<style>",
-        # CSS Variables - Default to Dark ("Lights Out") theme
-        ":root { "
-        "--bg-primary: hsl(0 0% 0%); "
-        "--bg-secondary: hsl(220 12% 10%); "
-        "--text-primary: hsl(200 7% 91%); "
-        "--text-secondary: hsl(240 5% 65%); "
-        "--border-color: hsl(210 7% 18%); "
-        "--accent-blue: hsl(204 88% 53%); "
-        "--accent-pink: hsl(356 91% 54%); "
-        "--accent-green: hsl(160 100% 36%); "
-        "--font-stack: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, "
-        "Helvetica, Arial, sans-serif; "
-        "--tweet-max-width: 600px; "
-        "--avatar-size: 48px; "
-        "}",
-        # Light theme
-        '[data-theme="light"] { '
-        "--bg-primary: hsl(0 0% 100%); "
-        "--bg-secondary: hsl(180 14% 97%); "
-        "--text-primary: hsl(210 25% 8%); "
-        "--text-secondary: hsl(206 15% 38%); "
-        "--border-color: hsl(197 16% 91%); "
-        "}",
-        # Dim theme
-        '[data-theme="dim"] { '
-        "--bg-primary: hsl(210 34% 13%); "
-        "--bg-secondary: hsl(213 25% 16%); "
-        "--text-primary: hsl(180 14% 97%); "
-        "--text-secondary: hsl(240 5% 65%); "
-        "--border-color: hsl(210 21% 28%); "
-        "}",
-        # Base styles
-        "* { box-sizing: border-box; }",
-        "body { font-family: var(--font-stack); display: flex; margin: 0; "
-        "background: var(--bg-primary); color: var(--text-primary); min-height: 100vh; }",
-        "#filters { width: 280px; padding: 16px; border-right: 1px solid var(--border-color); "
-        "background: var(--bg-primary); overflow-y: auto; height: 100vh; "
-        "position: sticky; top: 0; flex-shrink: 0; }",
-        "#tweets { flex: 1; overflow-y: auto; height: 100vh; position: relative; }",
-        "#tweet-content { max-width: var(--tweet-max-width); margin: 0 auto; "
-        "border-left: 1px solid var(--border-color); "
-        "border-right: 1px solid var(--border-color); min-height: 100%; }",
-        # Tweet card styles
-        "article { border-bottom: 1px solid var(--border-color); padding: 12px 16px; }",
-        ".tweet-container { display: flex; gap: 12px; }",
-        ".tweet-avatar-col { flex-shrink: 0; display: flex; flex-direction: column; "
-        "align-items: center; }",
-        ".tweet-content-col { flex: 1; min-width: 0; }",
-        ".avatar { width: var(--avatar-size); height: var(--avatar-size); "
-        "border-radius: 9999px; object-fit: cover; }",
-        ".avatar-placeholder { width: var(--avatar-size); height: var(--avatar-size); "
-        "border-radius: 9999px; background: var(--text-secondary); }",
-        ".thread-connector { width: 2px; flex: 1; background: var(--border-color); "
-        "margin-top: 4px; min-height: 12px; }",
-        # Tweet header and content
-        ".tweet-header { display: flex; flex-wrap: wrap; align-items: baseline; gap: 4px; }",
-        ".author-name { font-weight: 700; color: var(--text-primary); font-size: 15px; }",
-        ".author-handle { color: var(--text-secondary); font-size: 15px; }",
-        ".tweet-time { color: var(--text-secondary); font-size: 15px; }",
-        ".tweet-time::before { content: '·'; margin: 0 4px; }",
-        ".tweet-body { color: var(--text-primary); font-size: 15px; line-height: 1.4; "
-        "word-wrap: break-word; margin-top: 4px; }",
-        # Links
-        "a { color: var(--accent-blue); text-decoration: none; }",
-        "a:hover { text-decoration: underline; }",
-        # Quoted tweets and retweets
-        ".quoted-tweet { margin-top: 12px; padding: 12px; border: 1px solid var(--border-color); "
-        "border-radius: 16px; background: var(--bg-secondary); }",
-        ".retweet-header { color: var(--text-secondary); font-size: 13px; font-weight: 700; "
-        "margin-bottom: 4px; margin-left: calc(var(--avatar-size) + 12px); }",
-        # Type badges
-        ".type-badges { display: inline-flex; margin-left: 4px; }",
-        ".type-badge { font-size: 14px; margin-right: 2px; cursor: default; }",
-        # Media
-        ".media-placeholder { background: var(--bg-secondary); "
-        "border: 1px solid var(--border-color); border-radius: 16px; padding: 40px; "
-        "text-align: center; color: var(--text-secondary); cursor: pointer; margin-top: 12px; }",
-        ".tweet-actions { margin-top: 12px; }",
-        ".view-link { color: var(--accent-blue); font-size: 13px; }",
-        ".tweet-stats { display: flex; gap: 16px; margin-top: 8px; color: var(--text-secondary); "
-        "font-size: 13px; }",
-        # Theme switcher - subtle, compact
-        "#theme-switcher { display: flex; gap: 4px; margin-bottom: 12px; }",
-        "#theme-switcher button { padding: 4px 8px; border: 1px solid var(--border-color); "
-        "background: transparent; color: var(--text-secondary); border-radius: 4px; "
-        "cursor: pointer; font-size: 11px; }",
-        "#theme-switcher button:hover { color: var(--text-primary); "
-        "border-color: var(--text-secondary); }",
-        "#theme-switcher button.active { color: var(--text-primary); "
-        "border-color: var(--text-primary); }",
-        # Filter sidebar
-        "#filters h3 { margin: 16px 0 8px; font-size: 14px; font-weight: 700; "
-        "color: var(--text-primary); }",
-        "#filters h3:first-of-type { margin-top: 0; }",
-        "#filters input[type='search'], #filters input[type='text'], "
-        "#filters input[type='date'] { width: 100%; padding: 12px 16px; "
-        "border: 1px solid var(--border-color); border-radius: 9999px; "
-        "background: var(--bg-secondary); color: var(--text-primary); "
-        "font-size: 15px; margin-bottom: 8px; }",
-        "#filters input:focus { outline: none; border-color: var(--accent-blue); }",
-        "#type-list { border: 1px solid var(--border-color); border-radius: 12px; "
-        "margin-bottom: 8px; }",
-        "#author-list { max-height: 200px; overflow-y: auto; "
-        "border: 1px solid var(--border-color); border-radius: 12px; margin-bottom: 8px; }",
-        "#type-list label, #author-list label { display: flex; align-items: center; "
-        "padding: 12px; cursor: pointer; border-bottom: 1px solid var(--border-color); "
-        "font-size: 14px; gap: 8px; }",
-        "#type-list label:last-child, #author-list label:last-child { border-bottom: none; }",
-        "#type-list label:hover, #author-list label:hover { background: var(--bg-secondary); }",
-        "#type-list .author-name, #author-list .author-name { flex: 1; overflow: hidden; "
-        "text-overflow: ellipsis; white-space: nowrap; min-width: 0; }",
-        "#type-list .author-count, #author-list .author-count { "
-        "flex-shrink: 0; color: var(--text-secondary); }",
-        "#filters button { width: 100%; padding: 12px; margin-top: 8px; "
-        "border: 1px solid var(--border-color); border-radius: 9999px; cursor: pointer; "
-        "background: var(--bg-secondary); color: var(--text-primary); font-weight: 700; }",
-        "#filters button:hover { background: var(--text-secondary); color: var(--bg-primary); }",
-        "#results-count { margin-top: 12px; font-size: 13px; "
-        "color: var(--text-secondary); text-align: center; }",
-        # Find bar styles (Ctrl+F replacement)
-        "#find-bar { display: none; position: fixed; top: 0; right: 0; "
-        "background: var(--bg-secondary); border: 1px solid var(--border-color); "
-        "border-radius: 0 0 0 8px; padding: 8px 12px; gap: 8px; align-items: center; "
-        "z-index: 1000; box-shadow: 0 2px 8px rgba(0,0,0,0.3); }",
-        "#find-input { padding: 6px 10px; border: 1px solid var(--border-color); "
-        "border-radius: 4px; background: var(--bg-primary); color: var(--text-primary); "
-        "font-size: 14px; width: 200px; }",
-        "#find-input:focus { outline: none; border-color: var(--accent-blue); }",
-        "#find-count { font-size: 13px; color: var(--text-secondary); min-width: 70px; }",
-        "#find-bar button { padding: 4px 8px; border: 1px solid var(--border-color); "
-        "background: transparent; color: var(--text-primary); border-radius: 4px; "
-        "cursor: pointer; font-size: 14px; }",
-        "#find-bar button:hover { background: var(--bg-primary); }",
-        "article.find-highlight { background: rgba(29, 155, 240, 0.15); }",
-        "mark.find-match { background: rgba(250, 204, 21, 0.4); color: inherit; "
-        "border-radius: 2px; padding: 0 2px; }",
-        # Virtual scrolling styles
-        "#tweet-viewport { position: relative; }",
-        "#tweet-container { position: absolute; top: 0; left: 0; right: 0; "
-        "max-width: var(--tweet-max-width); margin: 0 auto; }",
-        # Responsive
-        "@media (max-width: 768px) { body { flex-direction: column; } "
-        "#filters { width: 100%; height: auto; position: static; border-right: none; "
-        "border-bottom: 1px solid var(--border-color); } "
-        "#tweets { border-left: none; border-right: none; } }",
-        "</style>",
-        "<script>",
-        f"const TWEETS = {tweets_json};",
-        f"const QUOTED_TWEETS = {quoted_tweets_json};",
-        f"const FACETS = {facets_json};",
-        f"const THREAD_CONTEXT = {thread_context_json};",
-        "const TWEETS_MAP = Object.fromEntries([...TWEETS, ...QUOTED_TWEETS].map(t => [t.id, t]));",
-        "function escapeHtml(s) {",
-        "  const div = document.createElement('div');",
-        "  div.textContent = s;",
-        "  return div.innerHTML;",
-        "}",
-        "function expandUrls(text, urlsJson) {",
-        "  if (urlsJson) {",
-        "    try {",
-        "      const urls = JSON.parse(urlsJson);",
-        "      urls.forEach(u => { text = text.replace(u.url, u.expanded_url); });",
-        "    } catch (e) { console.warn('Failed to expand URLs:', e.message); }",
-        "  }",
-        "  text = text.replace(/\\s*https:\\/\\/t\\.co\\/\\w+/g, '');",
-        "  return text;",
-        "}",
-        "function linkifyUrls(text) {",
-        "  return text.replace(/(https?:\\/\\/[^\\s<]+)/g, "
-        '\'<a href="$1" target="_blank">$1</a>\');',
-        "}",
-        "function linkifyMentions(text) {",
-        "  return text.replace(/@(\\w+)/g, "
-        '\'<a href="https://x.com/$1" target="_blank">@$1</a>\');',
-        "}",
-        "function formatNewlines(text) {",
-        "  return text.replace(/\\n/g, '<br>');",
-        "}",
-        "function applyRichtext(text, tags) {",
-        "  if (!tags || !tags.length) return escapeHtml(text);",
-        "  // Sort tags by from_index in reverse order to avoid index shifting",
-        "  const sorted = [...tags].sort((a, b) => b.from_index - a.from_index);",
-        "  // Collect all boundaries",
-        "  const boundaries = new Set([0, text.length]);",
-        "  sorted.forEach(t => { boundaries.add(t.from_index); boundaries.add(t.to_index); });",
-        "  const sortedBoundaries = [...boundaries].sort((a, b) => a - b);",
-        "  // Build result by processing each segment",
-        "  let result = '';",
-        "  for (let i = 0; i < sortedBoundaries.length - 1; i++) {",
-        "    const start = sortedBoundaries[i];",
-        "    const end = sortedBoundaries[i + 1];",
-        "    let segment = escapeHtml(text.slice(start, end));",
-        "    // Find all tags that cover this segment",
-        "    for (const tag of sorted) {",
-        "      if (tag.from_index <= start && tag.to_index >= end) {",
-        "        if (tag.richtext_types.includes('Italic')) segment = `<em>${segment}</em>`;",
-        "        if (tag.richtext_types.includes('Bold')) segment = `<strong>${segment}</strong>`;",
-        "      }",
-        "    }",
-        "    result += segment;",
-        "  }",
-        "  return result;",
-        "}",
-        "function isValidMediaUrl(url) {",
-        "  return url && (url.startsWith('https://pbs.twimg.com/') "
-        "|| url.startsWith('https://video.twimg.com/'));",
-        "}",
-        "function isValidAvatarUrl(url) {",
-        "  return url && url.startsWith('https://pbs.twimg.com/');",
-        "}",
-        "function setTheme(theme) {",
-        "  document.documentElement.dataset.theme = theme;",
-        "  localStorage.setItem('tweethoarder-theme', theme);",
-        "  document.querySelectorAll('#theme-switcher button').forEach(btn => {",
-        "    btn.classList.toggle('active', btn.dataset.theme === theme);",
-        "  });",
-        "}",
-        "function renderMedia(mediaJson) {",
-        "  if (!mediaJson) return '';",
-        "  try {",
-        "    const media = JSON.parse(mediaJson);",
-        "    return media.map(m => {",
-        "      const w = m.width || 600;",
-        "      const h = m.height || 400;",
-        "      const aspectStyle = `aspect-ratio: ${w} / ${h}`;",
-        "      const baseStyle = 'max-width:100%;border-radius:8px;margin-top:8px;width:100%;'",
-        "        + aspectStyle + ';';",
-        "      if (m.type === 'video' || m.type === 'animated_gif') {",
-        "        const videoUrl = m.video_url;",
-        "        if (!videoUrl || !isValidMediaUrl(videoUrl)) return '';",
-        "        const isGif = m.type === 'animated_gif';",
-        "        const attrs = isGif ? 'autoplay loop muted playsinline' : 'controls';",
-        "        return `<video ${attrs} style='${baseStyle}object-fit:cover' "
-        "preload='metadata'>` + `<source src='${videoUrl}' type='video/mp4'>"
-        "Your browser does not support video.</video>`;",
-        "      } else {",
-        "        const url = m.media_url_https || m.media_url;",
-        "        if (!isValidMediaUrl(url)) return '';",
-        "        return `<img src='${url}' loading='lazy' style='${baseStyle}object-fit:cover'>`;",
-        "      }",
-        "    }).join('');",
-        "  } catch (e) { console.error('Failed to render media:', e.message); return ''; }",
-        "}",
-        "function copyAsMarkdown(md) { navigator.clipboard.writeText(md); }",
-        "function getPlainTextWithUrls(text, urlsJson) { return text; }",
-        "function formatQuotedTweetMarkdown(qt) {",
-        "  if (!qt) return '';",
-        "  const text = getPlainTextWithUrls(qt.text, qt.urls_json);",
-        "  return `\\n\\n> **@${qt.author_username}**\\n> ${text.replace(/\\n/g, '\\n> ')}`;",
-        "}",
-        "function formatMediaMarkdown(mediaJson) {",
-        "  if (!mediaJson) return '';",
-        "  try {",
-        "    const media = JSON.parse(mediaJson);",
-        "    if (!Array.isArray(media)) return '';",
-        "    return media.map(m => {",
-        "      if (m.type === 'video') {",
-        "        if (!m.video_url) return '';",
-        "        return `[Video](${m.video_url})`;",
-        "      }",
-        "      if (m.type === 'animated_gif') {",
-        "        if (!m.video_url) return '';",
-        "        return `[GIF](${m.video_url})`;",
-        "      }",
-        "      if (!m.media_url_https) return '';",
-        "      return `![](${m.media_url_https})`;",
-        "    }).filter(x => x).join('\\n');",
-        "  } catch (e) { return ''; }",
-        "}",
-        "function formatTweetAsMarkdown(t) {",
-        "  const url = `https://x.com/${t.author_username}/status/${t.id}`;",
-        "  const text = getPlainTextWithUrls(t.text, t.urls_json);",
-        "  const qt = t.quoted_tweet_id ? TWEETS_MAP[t.quoted_tweet_id] : null;",
-        "  const qtMd = formatQuotedTweetMarkdown(qt);",
-        "  const mediaMd = formatMediaMarkdown(t.media_json);",
-        "  const imgPart = mediaMd ? `\\n\\n${mediaMd}` : '';",
-        "  return `**@${t.author_username}**\\n\\n${text}${imgPart}${qtMd}\\n\\n`"
-        " + `[View on X](${url})`;",
-        "}",
-        "function handleCopy(t) { copyAsMarkdown(formatTweetAsMarkdown(t)); }",
-        "function hc(id) { handleCopy(TWEETS_MAP[id]); }",
-        "function getThreadText(tweet) {",
-        "  const convId = tweet.conversation_id;",
-        "  if (!convId || !THREAD_CONTEXT[convId]) return '';",
-        "  return THREAD_CONTEXT[convId].map(t => t.text).join(' ');",
-        "}",
-        "function filterTweets(query) {",
-        "  if (!query) return TWEETS;",
-        "  const q = query.toLowerCase();",
-        "  return TWEETS.filter(t => {",
-        "    const mainText = t.text.toLowerCase();",
-        "    const threadText = getThreadText(t).toLowerCase();",
-        "    return mainText.includes(q) || threadText.includes(q);",
-        "  });",
-        "}",
-        "let selectedAuthors = new Set();",
-        "let selectedTypes = new Set();",
-        "const TYPE_LABELS = {like: 'Likes', bookmark: 'Bookmarks', tweet: 'My Tweets', "
-        "repost: 'Reposts', reply: 'Replies', feed: 'Feed'};",
-        "const TYPE_ICONS = {like: '\\u2764\\uFE0F', bookmark: '\\uD83D\\uDD16', "
-        "tweet: '\\uD83D\\uDC64', repost: '\\uD83D\\uDD01', reply: '\\u21A9\\uFE0F', "
-        "feed: '\\uD83C\\uDFE0'};",
-        "function renderStats(t) {",
-        "  const stats = [];",
-        "  if (t.reply_count) stats.push('💬 ' + t.reply_count);",
-        "  if (t.retweet_count) stats.push('🔁 ' + t.retweet_count);",
-        "  if (t.like_count) stats.push('❤️ ' + t.like_count);",
-        "  if (t.quote_count) stats.push('💭 ' + t.quote_count);",
-        "  return stats.length ? '<div class=\"tweet-stats\">' + stats.join(' ') + '</div>' : '';",
-        "}",
-        "function renderTypeBadges(types) {",
-        "  if (!types || types.length === 0) return '';",
-        "  return '<span class=\"type-badges\">' + types.map(t => "
-        '`<span class="type-badge" title="${TYPE_LABELS[t] || t}">${TYPE_ICONS[t] || \'\'}'
-        "</span>`).join('') + '</span>';",
-        "}",
-        "function renderTypeList() {",
-        "  const list = document.getElementById('type-list');",
-        "  if (!FACETS.types || Object.keys(FACETS.types).length === 0) {",
-        "    list.style.display = 'none';",
-        "    const header = list.previousElementSibling;",
-        "    if (header && header.tagName === 'H3') header.style.display = 'none';",
-        "    return;",
-        "  }",
-        "  list.replaceChildren();",
-        "  Object.entries(FACETS.types).forEach(([type, count]) => {",
-        "    const label = document.createElement('label');",
-        "    label.className = selectedTypes.has(type) ? 'selected' : '';",
-        "    const checkbox = document.createElement('input');",
-        "    checkbox.type = 'checkbox';",
-        "    checkbox.value = type;",
-        "    checkbox.checked = selectedTypes.size === 0 || selectedTypes.has(type);",
-        "    const nameSpan = document.createElement('span');",
-        "    nameSpan.className = 'author-name';",
-        "    nameSpan.textContent = TYPE_LABELS[type] || type;",
-        "    const countSpan = document.createElement('span');",
-        "    countSpan.className = 'author-count';",
-        "    countSpan.textContent = count;",
-        "    label.appendChild(checkbox);",
-        "    label.appendChild(nameSpan);",
-        "    label.appendChild(countSpan);",
-        "    list.appendChild(label);",
-        "  });",
-        "}",
-        "function renderAuthorList(filterText) {",
-        "  const list = document.getElementById('author-list');",
-        "  list.replaceChildren();",
-        "  const ft = (filterText || '').toLowerCase();",
-        "  const filtered = ft.length >= 3",
-        "    ? FACETS.authors.filter(a =>",
-        "        a.username.toLowerCase().includes(ft) ||",
-        "        a.display_name.toLowerCase().includes(ft))",
-        "    : FACETS.authors;",
-        "  filtered.forEach(a => {",
-        "    const label = document.createElement('label');",
-        "    label.className = selectedAuthors.has(a.username) ? 'selected' : '';",
-        "    const checkbox = document.createElement('input');",
-        "    checkbox.type = 'checkbox';",
-        "    checkbox.value = a.username;",
-        "    checkbox.checked = selectedAuthors.has(a.username);",
-        "    const nameSpan = document.createElement('span');",
-        "    nameSpan.className = 'author-name';",
-        "    nameSpan.textContent = a.display_name + ' (@' + a.username + ')';",
-        "    const countSpan = document.createElement('span');",
-        "    countSpan.className = 'author-count';",
-        "    countSpan.textContent = a.count;",
-        "    label.appendChild(checkbox);",
-        "    label.appendChild(nameSpan);",
-        "    label.appendChild(countSpan);",
-        "    list.appendChild(label);",
-        "  });",
-        "}",
-        "function applyAllFilters() {",
-        "  const query = document.getElementById('search').value.toLowerCase();",
-        "  const fromDate = document.getElementById('date-from').value;",
-        "  const toDate = document.getElementById('date-to').value;",
-        "  let filtered = TWEETS;",
-        "  if (query) {",
-        "    filtered = filtered.filter(t => {",
-        "      const mainText = t.text.toLowerCase();",
-        "      const threadText = getThreadText(t).toLowerCase();",
-        "      return mainText.includes(query) || threadText.includes(query);",
-        "    });",
-        "  }",
-        "  if (selectedTypes.size > 0) {",
-        "    filtered = filtered.filter(t => {",
-        "      const types = t.collection_types || [];",
-        "      return types.some(ct => selectedTypes.has(ct));",
-        "    });",
-        "  }",
-        "  if (selectedAuthors.size > 0) {",
-        "    filtered = filtered.filter(t => selectedAuthors.has(t.author_username));",
-        "  }",
-        "  if (fromDate) {",
-        "    filtered = filtered.filter(t => t.created_at >= fromDate);",
-        "  }",
-        "  if (toDate) {",
-        "    filtered = filtered.filter(t => t.created_at <= toDate + 'T23:59:59');",
-        "  }",
-        "  document.getElementById('results-count').textContent =",
-        "    filtered.length + ' of ' + TWEETS.length + ' tweets';",
-        "  renderTweets(filtered);",
-        "}",
-        "function getThreadTweets(tweet) {",
-        "  const convId = tweet.conversation_id;",
-        "  if (!convId || !THREAD_CONTEXT[convId]) return [];",
-        "  const allTweets = THREAD_CONTEXT[convId];",
-        "  const authorId = tweet.author_id;",
-        "  // Filter to only include self-replies (author's thread posts)",
-        "  const threadTweets = allTweets.filter(t => {",
-        "    if (t.author_id !== authorId) return false;",
-        "    // Thread start (no reply) or self-reply (replying to own tweet)",
-        "    return !t.in_reply_to_user_id || t.in_reply_to_user_id === authorId;",
-        "  });",
-        "  // Topological sort by reply chain (in_reply_to_tweet_id)",
-        "  const byId = new Map(threadTweets.map(t => [t.id, t]));",
-        "  const children = new Map();",
-        "  const roots = [];",
-        "  threadTweets.forEach(t => {",
-        "    const parent = t.in_reply_to_tweet_id;",
-        "    if (!parent || !byId.has(parent)) { roots.push(t); return; }",
-        "    if (!children.has(parent)) children.set(parent, []);",
-        "    children.get(parent).push(t);",
-        "  });",
-        "  // Sort roots by created_at so oldest root comes first",
-        "  roots.sort((a,b) => a.created_at.localeCompare(b.created_at));",
-        "  // Walk chain from all roots",
-        "  const sorted = [];",
-        "  const queue = [...roots];",
-        "  while (queue.length > 0) {",
-        "    const current = queue.shift();",
-        "    sorted.push(current);",
-        "    const kids = children.get(current.id) || [];",
-        "    // Sort children by created_at as tiebreaker",
-        "    kids.sort((a,b) => a.created_at.localeCompare(b.created_at));",
-        "    queue.push(...kids);",
-        "  }",
-        "  return sorted;",
-        "}",
-        "// Virtual scrolling configuration",
-        "const ESTIMATED_ROW_HEIGHT = 150;",
-        "const BUFFER_SIZE = 10;",
-        "let currentFilteredTweets = [];",
-        "let scrollContainer = null;",
-        "let viewport = null;",
-        "let tweetContainer = null;",
-        "let rafId = null;",
-        "// Height cache for measured tweet heights (tweet ID -> height)",
-        "const heightCache = new Map();",
-        "// Get height for a tweet (measured or estimated)",
-        "function getItemHeight(tweet) {",
-        "  return heightCache.get(tweet.id) || ESTIMATED_ROW_HEIGHT;",
-        "}",
-        "// Calculate cumulative offset (sum of heights up to index)",
-        "function getOffsetForIndex(tweets, index) {",
-        "  let offset = 0;",
-        "  for (let i = 0; i < index && i < tweets.length; i++) {",
-        "    offset += getItemHeight(tweets[i]);",
-        "  }",
-        "  return offset;",
-        "}",
-        "// Binary search to find index at scroll position",
-        "function findIndexAtOffset(tweets, scrollTop) {",
-        "  if (tweets.length === 0) return 0;",
-        "  let low = 0, high = tweets.length - 1;",
-        "  let offset = 0;",
-        "  while (low < high) {",
-        "    const mid = Math.floor((low + high) / 2);",
-        "    const midOffset = getOffsetForIndex(tweets, mid);",
-        "    const midHeight = getItemHeight(tweets[mid]);",
-        "    if (scrollTop < midOffset) {",
-        "      high = mid - 1;",
-        "    } else if (scrollTop >= midOffset + midHeight) {",
-        "      low = mid + 1;",
-        "    } else {",
-        "      return mid;",
-        "    }",
-        "  }",
-        "  return Math.max(0, low);",
-        "}",
-        "// Get total height of all tweets",
-        "function getTotalHeight(tweets) {",
-        "  let total = 0;",
-        "  for (const tweet of tweets) {",
-        "    total += getItemHeight(tweet);",
-        "  }",
-        "  return total;",
-        "}",
-        "// Measure rendered items and update cache",
-        "function measureRenderedItems(startIdx) {",
-        "  if (!tweetContainer) return;",
-        "  const articles = tweetContainer.querySelectorAll('article');",
-        "  const tweets = currentFilteredTweets;",
-        "  articles.forEach((article, i) => {",
-        "    const idx = startIdx + i;",
-        "    if (idx < tweets.length) {",
-        "      const height = article.getBoundingClientRect().height;",
-        "      if (height > 0) heightCache.set(tweets[idx].id, height);",
-        "    }",
-        "  });",
-        "}",
-        "// Safe HTML rendering using template element",
-        "// Falls back gracefully if DOMPurify unavailable (e.g., local file:// protocol)",
-        "function safeRenderHTML(container, htmlContent) {",
-        "  const template = document.createElement('template');",
-        "  if (typeof DOMPurify !== 'undefined') {",
-        "    template.innerHTML = DOMPurify.sanitize(htmlContent, {",
-        "      ALLOWED_TAGS: ['article','div','p','span','a','img','video','source',"
-        "'strong','em','small','br','mark'],",
-        "      ALLOWED_ATTR: ['class','href','src','alt','target','title','style','loading',"
-        "'data-src','onclick','controls','autoplay','loop','muted','playsinline','preload',"
-        "'type']",
-        "    });",
-        "  } else {",
-        "    template.innerHTML = htmlContent;",
-        "  }",
-        "  container.replaceChildren(template.content);",
-        "}",
-        "function renderSingleTweet(t, tweetIdx, currentMatchIdx) {",
-        "  const isCurrentMatch = tweetIdx === currentMatchIdx;",
-        "  const highlightClass = isCurrentMatch ? ' find-highlight' : '';",
-        "  const threadTweets = getThreadTweets(t);",
-        "  // Only render as thread if current tweet is part of it (not a reply to someone else)",
-        "  const isThread = threadTweets.length > 1 && threadTweets.some(th => th.id === t.id);",
-        "  const dn = t.author_display_name || t.author_username;",
-        "  const dt = t.created_at ? t.created_at.slice(0, 16).replace('T', ' ') : '';",
-        "  const url = `https://x.com/${t.author_username}/status/${t.id}`;",
-        "  const av = isValidAvatarUrl(t.author_avatar_url)",
-        '    ? `<img src="${escapeHtml(t.author_avatar_url)}" alt="" '
-        'class="avatar" loading="lazy">`',
-        "    : '<div class=\"avatar-placeholder\"></div>';",
-        "  if (isThread) {",
-        "    const threadHtml = threadTweets.map(th => {",
-        "      const richTxt = applyRichtext(th.text, th.richtext_tags);",
-        "      const txt = expandUrls(richTxt, th.urls_json);",
-        "      const star = (t.highlighted_tweet_ids || []).includes(th.id) ? '\\u2B50 ' : '';",
-        "      return `<p>${star}${formatNewlines(linkifyMentions(linkifyUrls(txt)))}</p>`;",
-        "    }).join('');",
-        "    const badges = renderTypeBadges(t.collection_types);",
-        "    return `<article class='thread${highlightClass}'>",
-        "      <div class='tweet-container'>",
-        "        <div class='tweet-avatar-col'>",
-        "          ${av}",
-        "        </div>",
-        "        <div class='tweet-content-col'>",
-        "          <p>🧵 <span class='author-name'>Thread by ${escapeHtml(dn)}</span> "
-        "<span class='author-handle'>@${escapeHtml(t.author_username)}</span> ${badges}</p>",
-        "          ${threadHtml}",
-        '          <p><small>${dt} | <a href="${url}" target="_blank">View</a> | '
-        '<a href="#" onclick="hc(\'${t.id}\'); return false;">Copy</a></small></p>',
-        "        </div>",
-        "      </div>",
-        "    </article>`;",
-        "  }",
-        "  const richTxt = applyRichtext(t.text, t.richtext_tags);",
-        "  const txt = expandUrls(richTxt, t.urls_json);",
-        "  const rtHeader = (t.is_retweet && t.retweeter_username) ? "
-        "`<div class='retweet-header'>🔁 Retweeted by @${escapeHtml(t.retweeter_username)}"
-        "</div>` : '';",
-        "  const qt = t.quoted_tweet_id ? TWEETS_MAP[t.quoted_tweet_id] : null;",
-        "  const qtRichTxt = qt ? applyRichtext(qt.text, qt.richtext_tags) : '';",
-        "  const qtText = qt ? expandUrls(qtRichTxt, qt.urls_json) : '';",
-        "  const qtHtml = (qt && qt.author_username && qt.text) ? `<div class='quoted-tweet'>"
-        "<p><strong>${escapeHtml(qt.author_display_name || qt.author_username)}</strong> "
-        "@${escapeHtml(qt.author_username)}</p>"
-        "<p>${formatNewlines(linkifyMentions(linkifyUrls(qtText)))}</p></div>` :"
-        "(t.quoted_tweet_id ? '<div class=\"quoted-tweet\">Quoted tweet unavailable</div>' : '');",
-        "  const badges = renderTypeBadges(t.collection_types);",
-        "  return `<article class='${highlightClass.trim()}'>",
-        "    ${rtHeader}",
-        "    <div class='tweet-container'>",
-        "      <div class='tweet-avatar-col'>",
-        "        ${av}",
-        "      </div>",
-        "      <div class='tweet-content-col'>",
-        "        <p><span class='author-name'>${escapeHtml(dn)}</span> "
-        "<span class='author-handle'>@${escapeHtml(t.author_username)}</span> ${badges}</p>",
-        "        <p>${highlightFindText(formatNewlines(linkifyMentions(linkifyUrls(txt))))}</p>",
-        "        ${renderMedia(t.media_json)}",
-        "        ${qtHtml}",
-        "        ${renderStats(t)}",
-        '        <p><small>${dt} | <a href="${url}" target="_blank">View</a> | '
-        '<a href="#" onclick="hc(\'${t.id}\'); return false;">Copy</a></small></p>',
-        "      </div>",
-        "    </div>",
-        "  </article>`;",
-        "}",
-        "function updateVirtualScroll() {",
-        "  if (!scrollContainer || !viewport || !tweetContainer) return;",
-        "  const tweets = currentFilteredTweets;",
-        "  const totalHeight = getTotalHeight(tweets);",
-        "  viewport.style.height = totalHeight + 'px';",
-        "  const scrollTop = scrollContainer.scrollTop;",
-        "  const viewportHeight = scrollContainer.clientHeight;",
-        "  const scrollIdx = findIndexAtOffset(tweets, scrollTop);",
-        "  const startIdx = Math.max(0, scrollIdx - BUFFER_SIZE);",
-        "  const visibleCount = Math.ceil(viewportHeight / ESTIMATED_ROW_HEIGHT) + 5;",
-        "  const endIdx = Math.min(tweets.length, startIdx + visibleCount + BUFFER_SIZE * 2);",
-        "  const visibleTweets = tweets.slice(startIdx, endIdx);",
-        "  const startOffset = getOffsetForIndex(tweets, startIdx);",
-        "  tweetContainer.style.transform = `translateY(${startOffset}px)`;",
-        "  const currentMatchTweetIdx = findCurrentIdx >= 0 ? findMatches[findCurrentIdx] : -1;",
-        "  const html = visibleTweets.map((t, i) => "
-        "renderSingleTweet(t, startIdx + i, currentMatchTweetIdx)).join('');",
-        "  safeRenderHTML(tweetContainer, html);",
-        "  requestAnimationFrame(() => measureRenderedItems(startIdx));",
-        "}",
-        "function scheduleVirtualScrollUpdate() {",
-        "  if (rafId || isJumpingToMatch) return;",
-        "  rafId = requestAnimationFrame(() => {",
-        "    rafId = null;",
-        "    if (!isJumpingToMatch) updateVirtualScroll();",
-        "  });",
-        "}",
-        "function renderTweets(tweets) {",
-        "  currentFilteredTweets = tweets;",
-        "  if (scrollContainer) scrollContainer.scrollTop = 0;",
-        "  updateVirtualScroll();",
-        "}",
-        "// Debounce utility for filter inputs",
-        "function debounce(fn, delay) {",
-        "  let timeoutId;",
-        "  return function(...args) {",
-        "    clearTimeout(timeoutId);",
-        "    timeoutId = setTimeout(() => fn.apply(this, args), delay);",
-        "  };",
-        "}",
-        "// Find bar state (Ctrl+F replacement for virtual scroll)",
-        "let findMatches = [];",
-        "let findCurrentIdx = -1;",
-        "let findQuery = '';",
-        "let isJumpingToMatch = false;",
-        "function openFindBar() {",
-        "  const bar = document.getElementById('find-bar');",
-        "  bar.style.display = 'flex';",
-        "  const input = document.getElementById('find-input');",
-        "  input.focus();",
-        "  input.select();",
-        "}",
-        "function closeFindBar() {",
-        "  document.getElementById('find-bar').style.display = 'none';",
-        "  findMatches = [];",
-        "  findCurrentIdx = -1;",
-        "  findQuery = '';",
-        "  document.getElementById('find-count').textContent = '';",
-        "  updateVirtualScroll();",
-        "}",
-        "function updateFindMatches(query) {",
-        "  findQuery = query.toLowerCase();",
-        "  if (!findQuery) {",
-        "    findMatches = [];",
-        "    findCurrentIdx = -1;",
-        "    document.getElementById('find-count').textContent = '';",
-        "    return;",
-        "  }",
-        "  findMatches = [];",
-        "  currentFilteredTweets.forEach((t, idx) => {",
-        "    const mainText = t.text.toLowerCase();",
-        "    const threadText = getThreadText(t).toLowerCase();",
-        "    if (mainText.includes(findQuery) || threadText.includes(findQuery)) "
-        "findMatches.push(idx);",
-        "  });",
-        "  findCurrentIdx = findMatches.length > 0 ? 0 : -1;",
-        "  updateFindCount();",
-        "  if (findCurrentIdx >= 0) jumpToFindMatch();",
-        "}",
-        "function updateFindCount() {",
-        "  const countEl = document.getElementById('find-count');",
-        "  if (findMatches.length === 0) {",
-        "    countEl.textContent = findQuery ? 'No matches' : '';",
-        "  } else {",
-        "    countEl.textContent = `${findCurrentIdx + 1} of ${findMatches.length}`;",
-        "  }",
-        "}",
-        "function jumpToFindMatch() {",
-        "  if (findCurrentIdx < 0 || findMatches.length === 0) return;",
-        "  isJumpingToMatch = true;",
-        "  const tweetIdx = findMatches[findCurrentIdx];",
-        "  const scrollTop = getOffsetForIndex(currentFilteredTweets, tweetIdx);",
-        "  scrollContainer.scrollTop = scrollTop;",
-        "  updateFindCount();",
-        "  updateVirtualScroll();",
-        "  // After render, scroll the highlighted element into view",
-        "  setTimeout(() => {",
-        "    const highlighted = document.querySelector('.find-highlight');",
-        "    if (highlighted) {",
-        "      highlighted.scrollIntoView({ block: 'center', behavior: 'instant' });",
-        "    }",
-        "    setTimeout(() => { isJumpingToMatch = false; }, 50);",
-        "  }, 20);",
-        "}",
-        "// Highlight matching text in content",
-        "function highlightFindText(text) {",
-        "  if (!findQuery) return text;",
-        "  const esc = findQuery.replace(/[.*+?^${}()|[\\]\\\\]/g,'\\\\$&');",
-        "  const regex = new RegExp(`(${esc})`, 'gi');",
-        "  return text.replace(regex, '<mark class=\"find-match\">$1</mark>');",
-        "}",
-        "function findNext() {",
-        "  if (findMatches.length === 0) return;",
-        "  findCurrentIdx = (findCurrentIdx + 1) % findMatches.length;",
-        "  jumpToFindMatch();",
-        "}",
-        "function findPrev() {",
-        "  if (findMatches.length === 0) return;",
-        "  findCurrentIdx = (findCurrentIdx - 1 + findMatches.length) % findMatches.length;",
-        "  jumpToFindMatch();",
-        "}",
-        "document.addEventListener('keydown', (e) => {",
-        "  if ((e.ctrlKey || e.metaKey) && e.key === 'f') {",
-        "    e.preventDefault();",
-        "    openFindBar();",
-        "  }",
-        "  if (e.key === 'Escape') closeFindBar();",
-        "});",
-        "document.addEventListener('DOMContentLoaded', () => {",
-        "  // Initialize virtual scroll containers",
-        "  scrollContainer = document.getElementById('tweets');",
-        "  viewport = document.getElementById('tweet-viewport');",
-        "  tweetContainer = document.getElementById('tweet-container');",
-        "  // Add scroll listener for virtual scrolling",
-        "  scrollContainer.addEventListener('scroll', scheduleVirtualScrollUpdate, "
-        "{ passive: true });",
-        "  const search = document.getElementById('search');",
-        "  // Debounce search input for better performance",
-        "  const debouncedFilter = debounce(applyAllFilters, 150);",
-        "  search.addEventListener('input', debouncedFilter);",
-        "  const typeList = document.getElementById('type-list');",
-        "  typeList.addEventListener('change', (e) => {",
-        "    if (e.target.type === 'checkbox') {",
-        "      const type = e.target.value;",
-        "      if (e.target.checked) {",
-        "        selectedTypes.add(type);",
-        "        if (selectedTypes.size === Object.keys(FACETS.types).length) {",
-        "          selectedTypes.clear();",
-        "        }",
-        "      } else {",
-        "        if (selectedTypes.size === 0) {",
-        "          Object.keys(FACETS.types).forEach(t => {",
-        "            if (t !== type) selectedTypes.add(t);",
-        "          });",
-        "        } else {",
-        "          selectedTypes.delete(type);",
-        "        }",
-        "      }",
-        "      renderTypeList();",
-        "      applyAllFilters();",
-        "    }",
-        "  });",
-        "  const authorSearch = document.getElementById('author-search');",
-        "  const debouncedAuthorSearch = debounce("
-        "() => renderAuthorList(authorSearch.value), 150);",
-        "  authorSearch.addEventListener('input', debouncedAuthorSearch);",
-        "  const authorList = document.getElementById('author-list');",
-        "  authorList.addEventListener('change', (e) => {",
-        "    if (e.target.type === 'checkbox') {",
-        "      if (e.target.checked) {",
-        "        selectedAuthors.add(e.target.value);",
-        "      } else {",
-        "        selectedAuthors.delete(e.target.value);",
-        "      }",
-        "      renderAuthorList(authorSearch.value);",
-        "      applyAllFilters();",
-        "    }",
-        "  });",
-        "  document.getElementById('date-from').addEventListener('change', applyAllFilters);",
-        "  document.getElementById('date-to').addEventListener('change', applyAllFilters);",
-        "  document.getElementById('clear-filters').addEventListener('click', () => {",
-        "    search.value = '';",
-        "    authorSearch.value = '';",
-        "    selectedAuthors.clear();",
-        "    selectedTypes.clear();",
-        "    document.getElementById('date-from').value = '';",
-        "    document.getElementById('date-to').value = '';",
-        "    renderTypeList();",
-        "    renderAuthorList('');",
-        "    applyAllFilters();",
-        "  });",
-        "  const themeSwitcher = document.getElementById('theme-switcher');",
-        "  themeSwitcher.addEventListener('click', (e) => {",
-        "    if (e.target.dataset.theme) setTheme(e.target.dataset.theme);",
-        "  });",
-        "  const savedTheme = localStorage.getItem('tweethoarder-theme') || 'dark';",
-        "  setTheme(savedTheme);",
-        "  renderTypeList();",
-        "  renderAuthorList('');",
-        "  applyAllFilters();",
-        "  // Find bar event listeners",
-        "  const findInput = document.getElementById('find-input');",
-        "  const debouncedFind = debounce((e) => updateFindMatches(e.target.value), 100);",
-        "  findInput.addEventListener('input', debouncedFind);",
-        "  findInput.addEventListener('keydown', (e) => {",
-        "    if (e.key === 'Enter') {",
-        "      e.preventDefault();",
-        "      if (e.shiftKey) findPrev(); else findNext();",
-        "    }",
-        "  });",
-        "});",
-        "</script>",
-        "</head>",
-        "<body>",
-        '<aside id="filters">',
-        "<h3>Theme</h3>",
-        '<div id="theme-switcher">',
-        '<button data-theme="dark">Lights Out</button>',
-        '<button data-theme="dim">Dim</button>',
-        '<button data-theme="light">Light</button>',
-        "</div>",
-        "<h3>Search</h3>",
-        '<input type="search" id="search" placeholder="Filter by content...">',
-        "<h3>Type</h3>",
-        '<div id="type-list"></div>',
-        "<h3>Author</h3>",
-        '<input type="text" id="author-search" placeholder="Filter authors...">',
-        '<div id="author-list"></div>',
-        "<h3>Date Range</h3>",
-        '<input type="date" id="date-from">',
-        '<input type="date" id="date-to">',
-        '<button id="clear-filters">Clear All Filters</button>',
-        '<div id="results-count"></div>',
-        "</aside>",
-        # Find bar (Ctrl+F replacement)
-        '<div id="find-bar">',
-        '<input type="text" id="find-input" placeholder="Find in tweets...">',
-        '<span id="find-count"></span>',
-        '<button onclick="findPrev()" title="Previous (Shift+Enter)">&#9650;</button>',
-        '<button onclick="findNext()" title="Next (Enter)">&#9660;</button>',
-        '<button onclick="closeFindBar()" title="Close (Esc)">&times;</button>',
-        "</div>",
-        '<main id="tweets">',
-        '<div id="tweet-content">',
-        '<div id="tweet-viewport">',
-        '<div id="tweet-container"></div>',
-        "</div>",
-        "</div>",
-        "</main>",
-    ]
-    lines.append("</body>")
-    lines.append("</html>")
-    content = "\n".join(lines)
-
-    output_path = output or _get_default_export_path(data_dir, collection, "html")
-    output_path.write_text(content)
+
+# File extension written by each export command, in the order "export all" runs them
+EXPORT_FORMATS = {"json": "json", "markdown": "md", "csv": "csv", "html": "html"}
+
+
+@app.command(name="all")
+def all_formats(
+    collection: str | None = typer.Option(
+        None,
+        "--collection",
+        help="Filter by collection type (likes, bookmarks, tweets, reposts, replies, posts, all).",
+    ),
+    folder: str | None = typer.Option(
+        None,
+        "--folder",
+        help="Filter bookmarks by folder name (only works with --collection bookmarks).",
+    ),
+    output_dir: Path | None = typer.Option(
+        None,
+        "--output-dir",
+        help="Directory to write the exports to (default: the data directory's exports/).",
+    ),
+    compress: bool = typer.Option(
+        False,
+        "--gzip",
+        help="Compress the outputs with gzip (adds .gz to the file names).",
+    ),
+) -> None:
+    """Export tweets to JSON, Markdown, CSV and HTML at once."""
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    from datetime import UTC, datetime
+
+    from tweethoarder.config import get_data_dir
+
+    data_dir = get_data_dir()
+    # All four files share one timestamp
+    timestamp = datetime.now(UTC)
+    suffix = ".gz" if compress else ""
+
+    # Each format runs in its own process with its own database connection, so the
+    # CPU-bound serialization of the four formats proceeds in parallel.
+    with ProcessPoolExecutor(max_workers=min(len(EXPORT_FORMATS), os.cpu_count() or 1)) as pool:
+        futures = [
+            pool.submit(
+                _run_export,
+                fmt,
+                collection,
+                folder,
+                _get_default_export_path(
+                    data_dir, collection, f"{ext}{suffix}", timestamp, output_dir
+                ),
+                compress,
+            )
+            for fmt, ext in EXPORT_FORMATS.items()
+        ]
+        for future in futures:
+            future.result()
+
+
+def _run_export(
+    fmt: str, collection: str | None, folder: str | None, output: Path, compress: bool
+) -> None:
+    """Run a single export command; the worker entry point for "export all"."""
+    if fmt == "json":
+        json(collection=collection, folder=folder, output=output, compress=compress, ndjson=False)
+    elif fmt == "markdown":
+        markdown(collection=collection, folder=folder, output=output, compress=compress)
+    elif fmt == "csv":
+        csv(collection=collection, folder=folder, output=output, compress=compress)
+    else:
+        html(collection=collection, folder=folder, output=output, compress=compress)
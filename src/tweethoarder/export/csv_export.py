@@ -2,16 +2,24 @@
 
 import csv
 import io
-from typing import Any
+from collections.abc import Iterable
+from typing import Any, TextIO
 
 CSV_COLUMNS = ["id", "text", "author_username", "author_display_name", "created_at"]
 
 
+def write_tweets_csv(tweets: Iterable[dict[str, Any]], fh: TextIO) -> None:
+    """Stream tweets as CSV rows to an open text file.
+
+    fh should be opened with newline="" so the csv module controls line endings.
+    """
+    writer = csv.writer(fh)
+    writer.writerow(CSV_COLUMNS)
+    writer.writerows([tweet.get(col, "") for col in CSV_COLUMNS] for tweet in tweets)
+
+
 def export_tweets_to_csv(tweets: list[dict[str, Any]]) -> str:
     """Export tweets to CSV format."""
     output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(CSV_COLUMNS)
-    for tweet in tweets:
-        writer.writerow([tweet.get(col, "") for col in CSV_COLUMNS])
+    write_tweets_csv(tweets, output)
     return output.getvalue()
@@ -0,0 +1,167 @@
+"""HTML export functionality for TweetHoarder."""
+
+import re
+from collections import Counter
+from importlib.resources import files
+from io import BufferedIOBase
+from typing import Any
+
+from tweethoarder.export.json_export import dumps_compact
+from tweethoarder.export.richtext import extract_richtext_tags
+
+# Matches a video media item in media_json. Checking the type field rather than any
+# "video" substring keeps animated GIFs, whose items also carry a video_url, as photos.
+VIDEO_MEDIA_RE = re.compile(r'"type"\s*:\s*"video"')
+
+# Tweet fields the HTML viewer reads; everything else is stripped to reduce file size.
+# Iterating this fixed tuple is cheaper than scanning every column of every tweet.
+HTML_TWEET_FIELDS = (
+    "id",
+    "text",
+    "author_id",
+    "author_username",
+    "author_display_name",
+    "reply_count",
+    "retweet_count",
+    "like_count",
+    "quote_count",
+    "author_avatar_url",
+    "created_at",
+    "conversation_id",
+    "in_reply_to_tweet_id",
+    "in_reply_to_user_id",
+    "urls_json",
+    "media_json",
+    "is_retweet",
+    "retweeter_username",
+    "quoted_tweet_id",
+    "richtext_tags",
+    "collection_types",
+    "highlighted_tweet_ids",
+)
+
+
+def _dumps_script(obj: Any) -> bytes:
+    r"""Serialize obj as a JavaScript literal that is safe to inline in a <script> element.
+
+    "<" can only occur inside JSON strings, where \u003c decodes to the same character,
+    so escaping it stops "</script>" or "<!--" in tweet text from ending the element.
+    """
+    return dumps_compact(obj).replace(b"<", b"\\u003c")
+
+
+def write_tweets_html(
+    fh: BufferedIOBase,
+    tweets: list[dict[str, Any]],
+    quoted_tweets: list[dict[str, Any]],
+    thread_context: dict[str, list[dict[str, Any]]],
+) -> None:
+    """Stream the self-contained HTML viewer for tweets to a binary file.
+
+    The tweets are embedded as JavaScript data and the viewer's facets (authors, months,
+    media kinds, collection types) are computed while they are written.
+
+    Args:
+        fh: Binary file to write to.
+        tweets: Deduplicated tweets to show, with richtext_tags already extracted.
+        quoted_tweets: Tweets quoted by the shown tweets that are not shown themselves.
+        thread_context: Dict mapping conversation_id to the tweets of that conversation.
+    """
+    author_counts: Counter[str] = Counter()
+    display_names: dict[str, str] = {}
+    month_counts: Counter[str] = Counter()
+    media_counts = {"photo": 0, "video": 0, "link": 0, "text_only": 0}
+    type_counts: Counter[str] = Counter()
+    embedded_ids: set[str] = set()
+
+    fh.write(HTML_HEAD)
+
+    # Strip, serialize and write each tweet while computing facets in the same pass,
+    # so neither a stripped copy of the list nor its full JSON text is held in memory
+    fh.write(b"const TWEETS = [")
+    for i, tweet in enumerate(tweets):
+        if i:
+            fh.write(b",")
+        fh.write(_dumps_script({k: tweet[k] for k in HTML_TWEET_FIELDS if k in tweet}))
+        embedded_ids.add(tweet["id"])
+
+        username = tweet.get("author_username", "unknown")
+        author_counts[username] += 1
+        if username not in display_names:
+            display_names[username] = tweet.get("author_display_name", username)
+
+        created_at = tweet.get("created_at", "")
+        if created_at and len(created_at) >= 7:
+            month = created_at[:7]  # YYYY-MM
+            month_counts[month] += 1
+
+        media_json = tweet.get("media_json")
+        urls_json = tweet.get("urls_json")
+        has_media = False
+
+        if media_json:
+            has_media = True
+            if VIDEO_MEDIA_RE.search(media_json):
+                media_counts["video"] += 1
+            else:
+                media_counts["photo"] += 1
+        elif urls_json:
+            has_media = True
+            media_counts["link"] += 1
+        if not has_media:
+            media_counts["text_only"] += 1
+
+        # Count collection types
+        type_counts.update(tweet.get("collection_types", ()))
+
+    # Include quoted tweets separately for TWEETS_MAP lookup only
+    stripped_quoted = [{k: t[k] for k in HTML_TWEET_FIELDS if k in t} for t in quoted_tweets]
+    embedded_ids.update(t["id"] for t in stripped_quoted)
+
+    facets = {
+        # most_common() is a stable sort, so tied authors keep first-seen order
+        "authors": [
+            {"username": u, "display_name": display_names[u], "count": c}
+            for u, c in author_counts.most_common()
+        ],
+        "months": [{"month": m, "count": c} for m, c in sorted(month_counts.items())],
+        "media": media_counts,
+        "types": dict(type_counts),
+    }
+
+    # Thread tweets already embedded in TWEETS or QUOTED_TWEETS are referenced by id;
+    # the rest get their richtext_tags extracted and unused fields stripped
+    stripped_thread_context: dict[str, list[str | dict[str, Any]]] = {}
+    for conv_id, thread_tweets in thread_context.items():
+        entries: list[str | dict[str, Any]] = []
+        for tweet in thread_tweets:
+            if tweet["id"] in embedded_ids:
+                entries.append(tweet["id"])
+                continue
+            richtext_tags = extract_richtext_tags(tweet.get("raw_json"))
+            if richtext_tags:
+                tweet["richtext_tags"] = richtext_tags
+            entries.append({k: tweet[k] for k in HTML_TWEET_FIELDS if k in tweet})
+        stripped_thread_context[conv_id] = entries
+
+    fh.writelines(
+        (
+            b"];\nconst QUOTED_TWEETS = ",
+            _dumps_script(stripped_quoted),
+            b";\nconst FACETS = ",
+            _dumps_script(facets),
+            b";\nconst THREAD_CONTEXT = ",
+            _dumps_script(stripped_thread_context),
+            b";\n",
+        )
+    )
+    fh.write(HTML_TAIL)
+
+
+# Static parts of the HTML viewer, read from the packaged template once at import time
+# and split at its data marker. The per-export data lines are streamed between them so
+# the document is never joined in memory, and the template is never re-encoded.
+_VIEWER_DATA_MARKER = b"// @@TWEETHOARDER_DATA@@\n"
+HTML_HEAD, _, HTML_TAIL = (
+    files("tweethoarder.export").joinpath("viewer.html").read_bytes().partition(_VIEWER_DATA_MARKER)
+)
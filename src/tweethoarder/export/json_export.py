@@ -1,9 +1,13 @@
 """JSON export functionality for TweetHoarder."""
 
 import json
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
 from typing import Any
 
+# Raised by loads_json() on malformed input, whichever parser is in use
+JSONDecodeError = json.JSONDecodeError
+
 
 def _format_tweet(
     tweet: dict[str, Any],
@@ -27,24 +31,74 @@ def _format_tweet(
             "like_count": tweet["like_count"],
         }
     if tweet.get("media_json"):
-        formatted["media"] = json.loads(tweet["media_json"])
+        formatted["media"] = loads_json(tweet["media_json"])
     quoted_id = tweet.get("quoted_tweet_id")
     if quoted_id and quoted_tweets and quoted_id in quoted_tweets:
         formatted["quoted_tweet"] = _format_tweet(quoted_tweets[quoted_id])
     return formatted
 
 
+def iter_formatted_tweets(
+    tweets: Iterable[dict[str, Any]],
+    quoted_tweets: dict[str, dict[str, Any]] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield each tweet in export format, one at a time, for line-delimited output."""
+    for tweet in tweets:
+        yield _format_tweet(tweet, quoted_tweets)
+
+
 def export_tweets_to_json(
     tweets: list[dict[str, Any]],
     collection: str | None = None,
     quoted_tweets: dict[str, dict[str, Any]] | None = None,
+    stream: bool = False,
 ) -> dict[str, Any]:
-    """Export tweets to a JSON-serializable dictionary."""
+    """Export tweets to a JSON-serializable dictionary.
+
+    With stream=True, "tweets" is a lazy iterator of formatted tweets instead of a
+    list, for writers that encode one tweet at a time; it can be consumed only once.
+    """
+    formatted = iter_formatted_tweets(tweets, quoted_tweets)
     result: dict[str, Any] = {
         "exported_at": datetime.now(UTC).isoformat(),
         "count": len(tweets),
-        "tweets": [_format_tweet(t, quoted_tweets) for t in tweets],
+        "tweets": formatted if stream else list(formatted),
     }
     if collection is not None:
         result["collection"] = collection
     return result
+
+
+def dumps_compact(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, preferring orjson when installed.
+
+    Both paths emit the same output, without escaping non-ASCII characters and
+    with non-string keys coerced to strings as the stdlib does.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes, preferring orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
+def loads_json(data: str | bytes) -> Any:
+    """Parse JSON, preferring orjson when installed.
+
+    orjson's JSONDecodeError subclasses json.JSONDecodeError, so callers catch the
+    module's JSONDecodeError either way.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
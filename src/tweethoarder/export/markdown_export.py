@@ -1,10 +1,12 @@
 """Markdown export functionality for TweetHoarder."""
 
+import io
 import json
 import re
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, TextIO
 
+from tweethoarder.export.json_export import loads_json
 from tweethoarder.export.richtext import (
     apply_richtext_tags_markdown,
     extract_richtext_tags,
@@ -57,7 +59,7 @@ def _expand_urls(text: str, urls_json: str | None) -> str:
     """Expand t.co URLs to their full URLs and strip media t.co URLs."""
     if urls_json:
         try:
-            urls = json.loads(urls_json)
+            urls = loads_json(urls_json)
             for url_info in urls:
                 short_url = url_info.get("url", "")
                 expanded_url = url_info.get("expanded_url", "")
@@ -108,24 +110,26 @@ def _format_parent_tweet(parent_tweet: dict[str, Any]) -> list[str]:
     return lines
 
 
-def export_tweets_to_markdown(
+def write_tweets_markdown(
     tweets: list[dict[str, Any]],
+    fh: TextIO,
     collection: str | None = None,
     thread_context: dict[str, list[dict[str, Any]]] | None = None,
     quoted_tweets: dict[str, dict[str, Any]] | None = None,
     parent_tweets: dict[str, dict[str, Any]] | None = None,
-) -> str:
-    """Export tweets to Markdown format.
+) -> None:
+    """Stream tweets as Markdown to an open text file.
+
+    Each tweet's section is written as soon as it is formatted, so the whole
+    document is never held in memory.
 
     Args:
         tweets: List of tweet dictionaries to export.
+        fh: Text file to write to.
         collection: Optional collection name for title.
         thread_context: Optional dict mapping conversation_id to list of thread tweets.
         quoted_tweets: Optional dict mapping tweet_id to quoted tweet data.
         parent_tweets: Optional dict mapping tweet_id to parent tweet data (for replies).
-
-    Returns:
-        Markdown formatted string.
     """
     lines: list[str] = []
 
@@ -136,8 +140,11 @@ def export_tweets_to_markdown(
     lines.append("")
     lines.append(f"Exported: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC")
     lines.append(f"Total: {len(tweets):,} tweets")
+    fh.write("\n".join(lines))
 
     for tweet in tweets:
+        # The leading "" supplies the newline that ends the previous section.
+        lines = [""]
         lines.append("")
         lines.append("---")
         lines.append("")
@@ -204,5 +211,35 @@ def export_tweets_to_markdown(
 
         tweet_id = tweet.get("id", "")
         lines.append(f"[View on Twitter](https://twitter.com/{username}/status/{tweet_id})")
+        fh.write("\n".join(lines))
 
-    return "\n".join(lines)
+
+def export_tweets_to_markdown(
+    tweets: list[dict[str, Any]],
+    collection: str | None = None,
+    thread_context: dict[str, list[dict[str, Any]]] | None = None,
+    quoted_tweets: dict[str, dict[str, Any]] | None = None,
+    parent_tweets: dict[str, dict[str, Any]] | None = None,
+) -> str:
+    """Export tweets to Markdown format.
+
+    Args:
+        tweets: List of tweet dictionaries to export.
+        collection: Optional collection name for title.
+        thread_context: Optional dict mapping conversation_id to list of thread tweets.
+        quoted_tweets: Optional dict mapping tweet_id to quoted tweet data.
+        parent_tweets: Optional dict mapping tweet_id to parent tweet data (for replies).
+
+    Returns:
+        Markdown formatted string.
+    """
+    output = io.StringIO()
+    write_tweets_markdown(
+        tweets,
+        output,
+        collection=collection,
+        thread_context=thread_context,
+        quoted_tweets=quoted_tweets,
+        parent_tweets=parent_tweets,
+    )
+    return output.getvalue()
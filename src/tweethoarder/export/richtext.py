@@ -7,6 +7,8 @@ from Twitter Notes' richtext_tags structure.
 import json
 from typing import Any
 
+from tweethoarder.export.json_export import loads_json
+
 
 def extract_richtext_tags(raw_json: str | None) -> list[dict[str, Any]] | None:
     """Extract richtext_tags from raw_json if available.
@@ -22,14 +24,29 @@ def extract_richtext_tags(raw_json: str | None) -> list[dict[str, Any]] | None:
         return None
 
     try:
-        data = json.loads(raw_json)
+        data = loads_json(raw_json)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    return richtext_tags_from_raw(data)
+
+
+def richtext_tags_from_raw(data: Any) -> list[dict[str, Any]] | None:
+    """Extract richtext_tags from an already parsed raw_json payload.
+
+    Args:
+        data: The parsed raw JSON from the Twitter API response.
+
+    Returns:
+        List of richtext_tags dictionaries, or None if not available.
+    """
+    try:
         note_tweet = data.get("note_tweet", {}).get("note_tweet_results", {}).get("result", {})
         richtext = note_tweet.get("richtext", {})
         tags = richtext.get("richtext_tags")
         if tags is None:
             return None
         return list(tags)  # Explicit conversion to satisfy type checker
-    except (json.JSONDecodeError, TypeError, AttributeError):
+    except (TypeError, AttributeError):
         return None
 
 
@@ -1,9 +1,14 @@
 """Database management for TweetHoarder."""
 
 import sqlite3
+from collections.abc import Generator, Sequence
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
+# Bound on "?" placeholders per statement (older SQLite builds cap this at 999).
+SQLITE_MAX_PARAMS = 900
+
 TWEETS_SCHEMA = """
 CREATE TABLE IF NOT EXISTS tweets (
     id TEXT PRIMARY KEY,
@@ -118,6 +123,74 @@ def get_db_path() -> Path:
     return data_dir / "tweethoarder.db"
 
 
+# Memory-map up to 256 MiB of the database and cache up to 64 MiB of pages for the
+# bulk reads done inside open_db()
+READ_MMAP_SIZE = 256 * 1024 * 1024
+READ_CACHE_KIB = 64 * 1024
+
+# Connections opened by open_db(), reused by the read helpers below.
+_shared_connections: dict[Path, sqlite3.Connection] = {}
+
+
+@contextmanager
+def open_db(db_path: Path) -> Generator[sqlite3.Connection]:
+    """Share one read connection across the query helpers for the duration of a block.
+
+    The read helpers normally open a fresh connection per call, which also discards
+    sqlite3's per-connection statement cache. Inside this block they reuse a single
+    connection instead, and all reads see one consistent snapshot of the database.
+    The connection is read-only and tuned for large scans with a memory-mapped file
+    and a bigger page cache. A nested block for the same database reuses the outer
+    block's connection and leaves it open on exit.
+
+    Args:
+        db_path: Path to the SQLite database file.
+
+    Yields:
+        The shared connection.
+    """
+    shared = _shared_connections.get(db_path)
+    if shared is not None:
+        yield shared
+        return
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA query_only = ON")
+    conn.execute(f"PRAGMA mmap_size = {READ_MMAP_SIZE}")
+    conn.execute(f"PRAGMA cache_size = -{READ_CACHE_KIB}")
+    conn.execute("BEGIN")
+    _shared_connections[db_path] = conn
+    try:
+        yield conn
+    finally:
+        del _shared_connections[db_path]
+        conn.rollback()
+        conn.close()
+
+
+@contextmanager
+def _read_connection(db_path: Path) -> Generator[sqlite3.Connection]:
+    """Yield the open_db() connection for db_path, or a fresh one returning Row objects."""
+    shared = _shared_connections.get(db_path)
+    if shared is not None:
+        yield shared
+        return
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        yield conn
+
+
+def _fetch_dicts(cursor: sqlite3.Cursor) -> list[dict[str, Any]]:
+    """Fetch the remaining rows of cursor as dictionaries.
+
+    Zipping plain tuples with the column names is more than twice as fast as
+    building sqlite3.Row objects and converting each one with dict().
+    """
+    cursor.row_factory = None
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row, strict=True)) for row in cursor]
+
+
 def _migrate_sync_progress_add_counter(conn: sqlite3.Connection) -> None:
     """Add sort_index_counter column to sync_progress table if it doesn't exist."""
     cursor = conn.execute("PRAGMA table_info(sync_progress)")
@@ -274,8 +347,7 @@ def get_tweets_by_collection(db_path: Path, collection_type: str) -> list[dict[s
         List of tweet dictionaries ordered by sort_index (Twitter's timeline order),
         falling back to added_at for entries without sort_index.
     """
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
+    with _read_connection(db_path) as conn:
         cursor = conn.execute(
             """
             SELECT t.* FROM tweets t
@@ -285,7 +357,7 @@ def get_tweets_by_collection(db_path: Path, collection_type: str) -> list[dict[s
             """,
             (collection_type,),
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return _fetch_dicts(cursor)
 
 
 def get_all_tweets(db_path: Path) -> list[dict[str, Any]]:
@@ -297,15 +369,14 @@ def get_all_tweets(db_path: Path) -> list[dict[str, Any]]:
     Returns:
         List of tweet dictionaries ordered by creation date (most recent first).
     """
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
+    with _read_connection(db_path) as conn:
         cursor = conn.execute(
             """
             SELECT * FROM tweets
             ORDER BY created_at DESC
             """
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return _fetch_dicts(cursor)
 
 
 def get_tweets_by_bookmark_folder(db_path: Path, folder_name: str) -> list[dict[str, Any]]:
@@ -318,8 +389,7 @@ def get_tweets_by_bookmark_folder(db_path: Path, folder_name: str) -> list[dict[
     Returns:
         List of tweet dictionaries ordered by when they were added (most recent first).
     """
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
+    with _read_connection(db_path) as conn:
         cursor = conn.execute(
             """
             SELECT t.* FROM tweets t
@@ -329,13 +399,12 @@ def get_tweets_by_bookmark_folder(db_path: Path, folder_name: str) -> list[dict[
             """,
             (folder_name,),
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return _fetch_dicts(cursor)
 
 
 def get_tweets_by_conversation_id(db_path: Path, conversation_id: str) -> list[dict[str, Any]]:
     """Get all tweets in a conversation."""
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
+    with _read_connection(db_path) as conn:
         cursor = conn.execute(
             """
             SELECT * FROM tweets
@@ -344,7 +413,40 @@ def get_tweets_by_conversation_id(db_path: Path, conversation_id: str) -> list[d
             """,
             (conversation_id,),
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return _fetch_dicts(cursor)
+
+
+def get_tweets_by_conversation_ids(
+    db_path: Path, conversation_ids: list[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """Get all tweets for several conversations in one pass.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        conversation_ids: Conversation IDs to fetch.
+
+    Returns:
+        Dictionary mapping each conversation ID that has tweets to its tweets,
+        ordered by created_at ascending.
+    """
+    result: dict[str, list[dict[str, Any]]] = {}
+    if not conversation_ids:
+        return result
+    with _read_connection(db_path) as conn:
+        for start in range(0, len(conversation_ids), SQLITE_MAX_PARAMS):
+            chunk = conversation_ids[start : start + SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = conn.execute(
+                f"""
+                SELECT * FROM tweets
+                WHERE conversation_id IN ({placeholders})
+                ORDER BY conversation_id, created_at ASC
+                """,
+                chunk,
+            )
+            for tweet in _fetch_dicts(cursor):
+                result.setdefault(tweet["conversation_id"], []).append(tweet)
+    return result
 
 
 def get_tweets_by_ids(db_path: Path, tweet_ids: list[str]) -> list[dict[str, Any]]:
@@ -352,24 +454,29 @@ def get_tweets_by_ids(db_path: Path, tweet_ids: list[str]) -> list[dict[str, Any
 
     Args:
         db_path: Path to the SQLite database file.
-        tweet_ids: List of tweet IDs to fetch.
+        tweet_ids: Unique tweet IDs to fetch. Each ID is bound as its own SQL
+            parameter, so callers should drop duplicates first; large lists are
+            queried in chunks of SQLITE_MAX_PARAMS.
 
     Returns:
         List of tweet dictionaries for tweets that exist in the database.
     """
+    result: list[dict[str, Any]] = []
     if not tweet_ids:
-        return []
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
-        placeholders = ",".join("?" * len(tweet_ids))
-        cursor = conn.execute(
-            f"""
-            SELECT * FROM tweets
-            WHERE id IN ({placeholders})
-            """,
-            tweet_ids,
-        )
-        return [dict(row) for row in cursor.fetchall()]
+        return result
+    with _read_connection(db_path) as conn:
+        for start in range(0, len(tweet_ids), SQLITE_MAX_PARAMS):
+            chunk = tweet_ids[start : start + SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = conn.execute(
+                f"""
+                SELECT * FROM tweets
+                WHERE id IN ({placeholders})
+                """,
+                chunk,
+            )
+            result.extend(_fetch_dicts(cursor))
+    return result
 
 
 def tweet_exists(db_path: Path, tweet_id: str) -> bool:
@@ -400,12 +507,14 @@ def tweet_in_collection(db_path: Path, tweet_id: str, collection_type: str) -> b
         return cursor.fetchone() is not None
 
 
-def get_tweets_by_collections(db_path: Path, collection_types: list[str]) -> list[dict[str, Any]]:
+def get_tweets_by_collections(
+    db_path: Path, collection_types: Sequence[str]
+) -> list[dict[str, Any]]:
     """Get all tweets in multiple collections.
 
     Args:
         db_path: Path to the SQLite database file.
-        collection_types: List of collection types (e.g., ["tweet", "reply", "repost"]).
+        collection_types: Collection types (e.g., ["tweet", "reply", "repost"]).
 
     Returns:
         List of tweet dictionaries ordered by created_at (most recent first).
@@ -414,8 +523,7 @@ def get_tweets_by_collections(db_path: Path, collection_types: list[str]) -> lis
     """
     if not collection_types:
         return []
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
+    with _read_connection(db_path) as conn:
         placeholders = ",".join("?" * len(collection_types))
         cursor = conn.execute(
             f"""
@@ -426,7 +534,7 @@ def get_tweets_by_collections(db_path: Path, collection_types: list[str]) -> lis
             """,
             collection_types,
         )
-        return [dict(row) for row in cursor.fetchall()]
+        return _fetch_dicts(cursor)
 
 
 def get_parent_tweet(db_path: Path, reply_tweet_id: str) -> dict[str, Any] | None:
@@ -439,8 +547,7 @@ def get_parent_tweet(db_path: Path, reply_tweet_id: str) -> dict[str, Any] | Non
     Returns:
         The parent tweet as a dictionary, or None if not found.
     """
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
+    with _read_connection(db_path) as conn:
         # First get the in_reply_to_tweet_id from the reply
         cursor = conn.execute(
             "SELECT in_reply_to_tweet_id FROM tweets WHERE id = ?",
@@ -492,8 +599,7 @@ def get_all_tweets_with_collection_types(db_path: Path) -> list[dict[str, Any]]:
         containing a list of collection types the tweet belongs to.
         Ordered by created_at (most recent first).
     """
-    with sqlite3.connect(db_path) as conn:
-        conn.row_factory = sqlite3.Row
+    with _read_connection(db_path) as conn:
         # Get all tweets with their collection types using GROUP_CONCAT
         cursor = conn.execute(
             """
@@ -504,12 +610,9 @@ def get_all_tweets_with_collection_types(db_path: Path) -> list[dict[str, Any]]:
             ORDER BY t.created_at DESC
             """
         )
-        rows = cursor.fetchall()
-        result = []
-        for row in rows:
-            tweet = dict(row)
+        result = _fetch_dicts(cursor)
+        for tweet in result:
             # Convert comma-separated string to list
             types_str = tweet.pop("collection_types_str")
             tweet["collection_types"] = types_str.split(",") if types_str else []
-            result.append(tweet)
         return result
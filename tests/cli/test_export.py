@@ -74,6 +74,192 @@ def test_export_json_writes_file(tmp_path: Path, monkeypatch: object) -> None:
     assert "testuser" in content
 
 
+def test_export_json_output_same_without_orjson(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Export json should produce identical output with the stdlib json fallback."""
+    import json
+    import sys
+
+    _setup_test_db(tmp_path)
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+
+    native_path = tmp_path / "native.json"
+    runner.invoke(app, ["export", "json", "--collection", "likes", "--output", str(native_path)])
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    fallback_path = tmp_path / "fallback.json"
+    result = runner.invoke(
+        app, ["export", "json", "--collection", "likes", "--output", str(fallback_path)]
+    )
+
+    assert result.exit_code == 0
+    native = json.loads(native_path.read_text())
+    fallback = json.loads(fallback_path.read_text())
+    native.pop("exported_at")
+    fallback.pop("exported_at")
+    assert fallback == native
+    assert fallback_path.read_text().splitlines()[2:] == native_path.read_text().splitlines()[2:]
+
+
+def test_export_json_streamed_output_matches_indented_dump(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Export json should stream exactly what json.dumps(indent=2) would produce."""
+    import json
+
+    from tweethoarder.storage.database import add_to_collection, save_tweet
+
+    db_path = _setup_test_db(tmp_path)
+    save_tweet(
+        db_path,
+        {
+            "id": "124",
+            "text": "Zweiter Tweet \u00e9\nmit Bild",
+            "author_id": "456",
+            "author_username": "testuser",
+            "created_at": "2025-01-02T12:00:00Z",
+            "media_json": '[{"type": "photo", "width": 10}]',
+        },
+    )
+    add_to_collection(db_path, "124", "like")
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+
+    output_path = tmp_path / "output.json"
+    result = runner.invoke(
+        app, ["export", "json", "--collection", "likes", "--output", str(output_path)]
+    )
+
+    assert result.exit_code == 0
+    content = output_path.read_text()
+    data = json.loads(content)
+    assert data["count"] == len(data["tweets"]) == 2
+    assert content == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def test_export_json_ndjson_writes_one_tweet_per_line(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Export json --ndjson should write one JSON object per tweet line."""
+    import json
+
+    _setup_test_db(tmp_path)
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+
+    result = runner.invoke(app, ["export", "json", "--collection", "likes", "--ndjson"])
+
+    assert result.exit_code == 0
+    exports = list((tmp_path / "tweethoarder" / "exports").glob("likes_*.ndjson"))
+    assert len(exports) == 1
+    lines = exports[0].read_text().splitlines()
+    assert [json.loads(line)["author"]["username"] for line in lines] == ["testuser"]
+
+
+def test_export_json_ndjson_same_without_orjson(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Export json --ndjson should produce identical bytes with the stdlib fallback."""
+    import sys
+
+    _setup_test_db(tmp_path)
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+
+    native_path = tmp_path / "native.ndjson"
+    runner.invoke(app, ["export", "json", "--ndjson", "--output", str(native_path)])
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    fallback_path = tmp_path / "fallback.ndjson"
+    result = runner.invoke(app, ["export", "json", "--ndjson", "--output", str(fallback_path)])
+
+    assert result.exit_code == 0
+    assert fallback_path.read_bytes() == native_path.read_bytes()
+
+
+def test_export_csv_collection_all_exports_every_collected_tweet(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """--collection all should select the same tweets for every export format."""
+    _setup_test_db(tmp_path)
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+
+    output_path = tmp_path / "all.csv"
+    result = runner.invoke(
+        app, ["export", "csv", "--collection", "all", "--output", str(output_path)]
+    )
+
+    assert result.exit_code == 0
+    assert "testuser" in output_path.read_text()
+
+
+def test_export_json_gzip_compresses_default_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Export json --gzip should write a .json.gz file holding the same document."""
+    import gzip
+    import json
+
+    _setup_test_db(tmp_path)
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+
+    result = runner.invoke(app, ["export", "json", "--collection", "likes", "--gzip"])
+
+    assert result.exit_code == 0
+    exports = list((tmp_path / "tweethoarder" / "exports").glob("likes_*.json.gz"))
+    assert len(exports) == 1
+    with gzip.open(exports[0], "rt", encoding="utf-8") as fh:
+        data = json.load(fh)
+    assert data["tweets"][0]["author"]["username"] == "testuser"
+
+
+def test_export_csv_gzip_writes_compressed_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Export csv --gzip should compress the file given with --output."""
+    import gzip
+
+    _setup_test_db(tmp_path)
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+
+    output_path = tmp_path / "likes.csv.gz"
+    result = runner.invoke(
+        app, ["export", "csv", "--collection", "likes", "--gzip", "--output", str(output_path)]
+    )
+
+    assert result.exit_code == 0
+    content = gzip.decompress(output_path.read_bytes()).decode()
+    assert content.startswith("id,text,author_username")
+    assert "testuser" in content
+
+
+def test_export_all_writes_every_format(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Export all should write JSON, Markdown, CSV and HTML files sharing one timestamp."""
+    _setup_test_db(tmp_path)
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+
+    output_dir = tmp_path / "out"
+    result = runner.invoke(
+        app, ["export", "all", "--collection", "likes", "--output-dir", str(output_dir)]
+    )
+
+    assert result.exit_code == 0
+    files = sorted(output_dir.iterdir())
+    assert sorted(f.suffix for f in files) == [".csv", ".html", ".json", ".md"]
+    assert len({f.stem for f in files}) == 1
+    assert all("testuser" in f.read_text() for f in files)
+
+
+def test_export_all_defaults_to_data_dir_exports(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Export all without --output-dir should name files like the single-format commands."""
+    _setup_test_db(tmp_path)
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+
+    result = runner.invoke(app, ["export", "all", "--collection", "likes", "--gzip"])
+
+    assert result.exit_code == 0
+    files = sorted((tmp_path / "tweethoarder" / "exports").glob("likes_*.gz"))
+    assert [f.name.split(".", 1)[1] for f in files] == ["csv.gz", "html.gz", "json.gz", "md.gz"]
+
+
 def test_export_markdown_command_exists() -> None:
     """Export markdown subcommand should be available."""
     result = runner.invoke(app, ["export", "markdown", "--help"])
@@ -760,13 +946,13 @@ def test_export_markdown_continues_on_thread_context_error(tmp_path: Path) -> No
 
     output_path = tmp_path / "test.md"
 
-    def failing_get_tweets(*args: object, **kwargs: object) -> list[dict[str, object]]:
+    def failing_get_tweets(*args: object, **kwargs: object) -> dict[str, list[object]]:
         raise Exception("Database error")
 
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch(
-            "tweethoarder.storage.database.get_tweets_by_conversation_id",
+            "tweethoarder.storage.database.get_tweets_by_conversation_ids",
             side_effect=failing_get_tweets,
         ),
     ):
@@ -810,13 +996,13 @@ def test_export_html_continues_on_thread_context_error(tmp_path: Path) -> None:
 
     output_path = tmp_path / "test.html"
 
-    def failing_get_tweets(*args: object, **kwargs: object) -> list[dict[str, object]]:
+    def failing_get_tweets(*args: object, **kwargs: object) -> dict[str, list[object]]:
         raise Exception("Database error")
 
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch(
-            "tweethoarder.storage.database.get_tweets_by_conversation_id",
+            "tweethoarder.storage.database.get_tweets_by_conversation_ids",
             side_effect=failing_get_tweets,
         ),
     ):
@@ -30,11 +30,11 @@ def test_html_export_renders_avatar_with_styling(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -70,11 +70,11 @@ def test_html_export_renders_avatar_placeholder(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -110,11 +110,11 @@ def test_html_export_twitter_like_card_styling(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -164,11 +164,11 @@ def test_html_export_renders_quote_tweets(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -186,7 +186,7 @@ def test_html_export_renders_quote_tweets(tmp_path: Path) -> None:
 
         # JS should check for quoted_tweet_id and render nested tweet
         assert "quoted_tweet_id" in content
-        assert "TWEETS_MAP[t.quoted_tweet_id]" in content
+        assert "TWEETS_MAP.get(t.quoted_tweet_id)" in content
 
 
 def test_html_export_renders_retweets(tmp_path: Path) -> None:
@@ -215,11 +215,11 @@ def test_html_export_renders_retweets(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -258,11 +258,11 @@ def test_html_export_auto_loads_images_with_aspect_ratio(tmp_path: Path) -> None
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -305,11 +305,11 @@ def test_html_export_renders_media_in_template(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -343,11 +343,11 @@ def test_html_export_strips_unused_fields(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -398,11 +398,11 @@ def test_html_export_includes_thread_context(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = thread_tweets
+        mock_get_thread.return_value = {"1": thread_tweets}
 
         result = runner.invoke(
             app,
@@ -410,7 +410,7 @@ def test_html_export_includes_thread_context(tmp_path: Path) -> None:
         )
 
         assert result.exit_code == 0
-        # Should have called get_tweets_by_conversation_id for thread context
+        # Should have fetched thread context
         mock_get_thread.assert_called_once()
 
         # Check that thread_context is included in the HTML output
@@ -425,6 +425,61 @@ def test_html_export_includes_thread_context(tmp_path: Path) -> None:
         assert "getThreadText" in content  # Search uses thread text
 
 
+def test_html_export_references_embedded_thread_tweets_by_id(tmp_path: Path) -> None:
+    """Thread context should reference tweets already in TWEETS by id only."""
+    mock_tweets = [
+        {
+            "id": "1",
+            "text": "First tweet",
+            "author_id": "user1",
+            "author_username": "testuser",
+            "created_at": "2025-01-01T12:00:00Z",
+            "conversation_id": "1",
+        }
+    ]
+    thread_tweets = [
+        mock_tweets[0],
+        {
+            "id": "2",
+            "text": "Second tweet in thread",
+            "author_id": "user1",
+            "author_username": "testuser",
+            "created_at": "2025-01-01T12:01:00Z",
+            "conversation_id": "1",
+        },
+    ]
+
+    output_file = tmp_path / "test.html"
+
+    with (
+        patch("tweethoarder.config.get_data_dir") as mock_data_dir,
+        patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
+    ):
+        mock_data_dir.return_value = tmp_path
+        mock_get_tweets.return_value = mock_tweets
+        mock_get_thread.return_value = {"1": thread_tweets}
+
+        result = runner.invoke(
+            app,
+            ["export", "html", "--collection", "likes", "--output", str(output_file)],
+        )
+
+        assert result.exit_code == 0
+        content = output_file.read_text()
+
+        import json
+        import re
+
+        match = re.search(r"const THREAD_CONTEXT = (.*?);\n", content)
+        assert match is not None
+        thread_context = json.loads(match.group(1))
+        assert thread_context["1"][0] == "1"
+        assert thread_context["1"][1]["text"] == "Second tweet in thread"
+        # The viewer resolves id references through TWEETS_MAP
+        assert "TWEETS_MAP.get(x)" in content
+
+
 def test_html_export_validates_media_urls(tmp_path: Path) -> None:
     """HTML export should validate media URLs to prevent XSS."""
     mock_tweets = [
@@ -443,11 +498,11 @@ def test_html_export_validates_media_urls(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -484,11 +539,11 @@ def test_html_export_validates_avatar_urls(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -523,11 +578,11 @@ def test_html_export_expandurls_logs_errors(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -564,11 +619,11 @@ def test_html_export_strips_media_tco_urls(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -607,11 +662,11 @@ def test_html_export_makes_urls_clickable(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -645,11 +700,11 @@ def test_html_export_makes_mentions_clickable(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -683,11 +738,11 @@ def test_html_export_rendermedia_logs_errors(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -720,12 +775,12 @@ def test_html_export_quoted_tweet_validates_fields(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
         patch("tweethoarder.storage.database.get_tweets_by_ids") as mock_get_by_ids,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
         mock_get_by_ids.return_value = []  # No quoted tweets available
 
         result = runner.invoke(
@@ -742,6 +797,42 @@ def test_html_export_quoted_tweet_validates_fields(tmp_path: Path) -> None:
         assert "Quoted tweet unavailable" in content
 
 
+def test_html_export_fetches_each_quoted_tweet_once(tmp_path: Path) -> None:
+    """HTML export should deduplicate quoted tweet IDs before fetching them."""
+    mock_tweets = [
+        {
+            "id": str(i),
+            "text": "Quoting",
+            "author_id": "user1",
+            "author_username": "testuser",
+            "created_at": "2025-01-01T12:00:00Z",
+            "quoted_tweet_id": "99",
+        }
+        for i in range(3)
+    ]
+
+    output_file = tmp_path / "test.html"
+
+    with (
+        patch("tweethoarder.config.get_data_dir") as mock_data_dir,
+        patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_ids") as mock_get_by_ids,
+    ):
+        mock_data_dir.return_value = tmp_path
+        mock_get_tweets.return_value = mock_tweets
+        mock_get_thread.return_value = {}
+        mock_get_by_ids.return_value = []
+
+        result = runner.invoke(
+            app,
+            ["export", "html", "--collection", "likes", "--output", str(output_file)],
+        )
+
+        assert result.exit_code == 0
+        assert mock_get_by_ids.call_args.args[1] == ["99"]
+
+
 def test_html_export_handles_malformed_media_json(tmp_path: Path) -> None:
     """HTML export should handle malformed media_json gracefully."""
     mock_tweets = [
@@ -760,11 +851,11 @@ def test_html_export_handles_malformed_media_json(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -799,11 +890,11 @@ def test_html_export_preserves_newlines(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -855,12 +946,12 @@ def test_html_export_separates_main_and_quoted_tweets(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
         patch("tweethoarder.storage.database.get_tweets_by_ids") as mock_get_by_ids,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
         mock_get_by_ids.return_value = quoted_tweets
 
         result = runner.invoke(
@@ -925,11 +1016,11 @@ def test_html_export_applies_richtext_formatting(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -965,11 +1056,11 @@ def test_html_export_facets_include_display_name(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1017,11 +1108,11 @@ def test_html_export_has_author_filter_input(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1065,11 +1156,11 @@ def test_html_export_has_filter_javascript_functions(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1121,11 +1212,11 @@ def test_html_export_collection_all_includes_collection_types(tmp_path: Path) ->
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_all_tweets_with_collection_types") as mock_get_all,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_all.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1168,11 +1259,11 @@ def test_html_export_collection_all_has_type_filter_ui(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_all_tweets_with_collection_types") as mock_get_all,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_all.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1206,11 +1297,11 @@ def test_html_export_collection_all_has_type_filter_javascript(tmp_path: Path) -
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_all_tweets_with_collection_types") as mock_get_all,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_all.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1244,11 +1335,11 @@ def test_html_export_collection_all_has_type_badges(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_all_tweets_with_collection_types") as mock_get_all,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_all.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1281,11 +1372,11 @@ def test_html_export_uses_css_variables(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1329,11 +1420,11 @@ def test_html_export_has_theme_switcher_ui(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1373,11 +1464,11 @@ def test_html_export_has_theme_switcher_javascript(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1418,11 +1509,11 @@ def test_html_export_tweet_flex_layout(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1473,11 +1564,11 @@ def test_html_export_author_handle_separation(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1513,11 +1604,11 @@ def test_html_export_thread_connector_css(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1549,11 +1640,11 @@ def test_html_export_tweet_max_width(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1587,11 +1678,11 @@ def test_html_export_twitter_font_stack(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1648,11 +1739,11 @@ def test_html_export_deduplicates_repost_and_liked_original(tmp_path: Path) -> N
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_all_tweets_with_collection_types") as mock_get_all,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_all.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1711,11 +1802,11 @@ def test_html_export_keeps_repost_when_original_not_in_collection(tmp_path: Path
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_all_tweets_with_collection_types") as mock_get_all,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_all.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1774,11 +1865,11 @@ def test_html_export_deduplicates_tweets_from_same_thread(tmp_path: Path) -> Non
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = mock_tweets  # Thread context returns same tweets
+        mock_get_thread.return_value = {"1001": mock_tweets}  # Thread context returns same tweets
 
         result = runner.invoke(
             app,
@@ -1842,11 +1933,11 @@ def test_html_export_does_not_deduplicate_replies_to_others(tmp_path: Path) -> N
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get.return_value = mock_tweets
-        mock_thread.return_value = mock_tweets
+        mock_thread.return_value = {conversation_id: mock_tweets}
 
         result = runner.invoke(
             app,
@@ -1890,11 +1981,11 @@ def test_html_export_has_copy_as_markdown_function(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1925,11 +2016,11 @@ def test_html_export_has_copy_link_next_to_view(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -1983,11 +2074,11 @@ def test_html_export_thread_has_copy_link(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = thread_tweets
+        mock_get_thread.return_value = {"1": thread_tweets}
 
         result = runner.invoke(
             app,
@@ -2022,11 +2113,11 @@ def test_html_export_copy_markdown_uses_clipboard_api(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2057,11 +2148,11 @@ def test_html_export_has_format_tweet_as_markdown_function(tmp_path: Path) -> No
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2092,11 +2183,11 @@ def test_html_export_format_markdown_includes_view_link(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2129,11 +2220,11 @@ def test_html_export_format_markdown_includes_author_info(tmp_path: Path) -> Non
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2165,11 +2256,11 @@ def test_html_export_format_markdown_includes_tweet_text(tmp_path: Path) -> None
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2200,11 +2291,11 @@ def test_html_export_has_url_expansion_for_markdown(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2235,11 +2326,11 @@ def test_html_export_url_expansion_replaces_tco_urls(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2272,11 +2363,11 @@ def test_html_export_copy_link_calls_format_markdown(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2310,11 +2401,11 @@ def test_html_export_format_markdown_detailed_format(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2348,11 +2439,11 @@ def test_html_export_format_markdown_includes_display_name(tmp_path: Path) -> No
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2385,11 +2476,11 @@ def test_html_export_has_handle_copy_function(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2420,11 +2511,11 @@ def test_html_export_copy_link_uses_handle_copy(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2457,12 +2548,12 @@ def test_html_export_format_markdown_includes_quoted_tweet(tmp_path: Path) -> No
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
         patch("tweethoarder.storage.database.get_tweets_by_ids") as mock_get_by_ids,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
         mock_get_by_ids.return_value = [
             {
                 "id": "2",
@@ -2502,11 +2593,11 @@ def test_html_export_format_markdown_includes_images(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2537,11 +2628,11 @@ def test_html_export_format_media_markdown_parses_json(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2573,11 +2664,11 @@ def test_html_export_format_tweet_markdown_calls_format_media(tmp_path: Path) ->
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2610,11 +2701,11 @@ def test_html_export_has_tweet_content_wrapper_for_scrollbar_position(
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2652,11 +2743,11 @@ def test_html_export_renders_videos_with_video_tag(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2698,11 +2789,11 @@ def test_html_export_renders_animated_gifs_with_autoplay(tmp_path: Path) -> None
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2737,11 +2828,11 @@ def test_html_export_dompurify_allows_video_tags(tmp_path: Path) -> None:
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2780,11 +2871,11 @@ def test_html_export_format_media_markdown_handles_videos(tmp_path: Path) -> Non
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2816,11 +2907,11 @@ def test_html_export_format_media_markdown_skips_missing_urls(tmp_path: Path) ->
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2856,11 +2947,11 @@ def test_html_export_format_media_markdown_handles_parse_errors(tmp_path: Path)
     with (
         patch("tweethoarder.config.get_data_dir") as mock_data_dir,
         patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
-        patch("tweethoarder.storage.database.get_tweets_by_conversation_id") as mock_get_thread,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
     ):
         mock_data_dir.return_value = tmp_path
         mock_get_tweets.return_value = mock_tweets
-        mock_get_thread.return_value = []
+        mock_get_thread.return_value = {}
 
         result = runner.invoke(
             app,
@@ -2874,3 +2965,86 @@ def test_html_export_format_media_markdown_handles_parse_errors(tmp_path: Path)
         assert "try {" in content
         # Should validate parsed value is an array
         assert "Array.isArray" in content
+
+
+def test_html_export_tweet_text_cannot_close_script_element(tmp_path: Path) -> None:
+    """Tweet text containing </script> must stay inside the embedded data."""
+    mock_tweets = [
+        {
+            "id": "1",
+            "text": "</script><script>alert(1)</script> <!-- x",
+            "author_id": "user1",
+            "author_username": "testuser",
+            "created_at": "2025-01-01T12:00:00Z",
+        }
+    ]
+
+    output_file = tmp_path / "test.html"
+
+    with (
+        patch("tweethoarder.config.get_data_dir") as mock_data_dir,
+        patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
+    ):
+        mock_data_dir.return_value = tmp_path
+        mock_get_tweets.return_value = mock_tweets
+        mock_get_thread.return_value = {}
+
+        result = runner.invoke(
+            app,
+            ["export", "html", "--collection", "likes", "--output", str(output_file)],
+        )
+
+        assert result.exit_code == 0
+        content = output_file.read_text()
+
+        assert "alert(1)" in content
+        assert "</script><script>alert" not in content
+        tweets_match = re.search(r"const TWEETS = (\[.*?\]);", content)
+        assert tweets_match is not None
+        assert json.loads(tweets_match.group(1))[0]["text"] == mock_tweets[0]["text"]
+
+
+def test_html_export_media_facet_counts_gifs_as_photos(tmp_path: Path) -> None:
+    """Only media items typed as video count toward the video facet."""
+    mock_tweets = [
+        {
+            "id": "1",
+            "text": "Video",
+            "author_id": "user1",
+            "author_username": "testuser",
+            "created_at": "2025-01-01T12:00:00Z",
+            "media_json": '[{"type": "video", "video_url": "https://video.twimg.com/v.mp4"}]',
+        },
+        {
+            "id": "2",
+            "text": "GIF",
+            "author_id": "user1",
+            "author_username": "testuser",
+            "created_at": "2025-01-01T12:00:00Z",
+            "media_json": '[{"type": "animated_gif", "video_url": "https://video.twimg.com/g.mp4"}]',
+        },
+    ]
+
+    output_file = tmp_path / "test.html"
+
+    with (
+        patch("tweethoarder.config.get_data_dir") as mock_data_dir,
+        patch("tweethoarder.storage.database.get_tweets_by_collection") as mock_get_tweets,
+        patch("tweethoarder.storage.database.get_tweets_by_conversation_ids") as mock_get_thread,
+    ):
+        mock_data_dir.return_value = tmp_path
+        mock_get_tweets.return_value = mock_tweets
+        mock_get_thread.return_value = {}
+
+        result = runner.invoke(
+            app,
+            ["export", "html", "--collection", "likes", "--output", str(output_file)],
+        )
+
+        assert result.exit_code == 0
+        facets_match = re.search(r"const FACETS = ({.*?});", output_file.read_text())
+        assert facets_match is not None
+        media = json.loads(facets_match.group(1))["media"]
+        assert media["video"] == 1
+        assert media["photo"] == 1
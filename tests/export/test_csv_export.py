@@ -1,5 +1,6 @@
 """Tests for CSV export functionality."""
 
+from pathlib import Path
 from typing import Any
 
 from tweethoarder.export.csv_export import export_tweets_to_csv
@@ -28,3 +29,15 @@ def test_export_includes_tweet_data(make_tweet: Any) -> None:
     assert "999" in result
     assert "Hello CSV" in result
     assert "csvuser" in result
+
+
+def test_write_tweets_csv_streams_to_file(make_tweet: Any, tmp_path: Path) -> None:
+    """Streaming writer produces the same CSV as the string export."""
+    from tweethoarder.export.csv_export import write_tweets_csv
+
+    tweets = [make_tweet(tweet_id="1", text="Line one\nline two"), make_tweet(tweet_id="2")]
+    output_path = tmp_path / "out.csv"
+    with output_path.open("w", newline="", encoding="utf-8") as fh:
+        write_tweets_csv(iter(tweets), fh)
+
+    assert output_path.read_text(encoding="utf-8", newline="") == export_tweets_to_csv(tweets)
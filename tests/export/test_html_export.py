@@ -0,0 +1,50 @@
+"""Tests for HTML export functionality."""
+
+import io
+import json
+import re
+from typing import Any
+
+from tweethoarder.export.html_export import HTML_HEAD, HTML_TAIL, write_tweets_html
+
+
+def test_write_tweets_html_embeds_tweets_and_facets(make_tweet: Any) -> None:
+    """The viewer embeds the stripped tweets and facets computed from them."""
+    tweets = [make_tweet(tweet_id="1", text="Hello"), make_tweet(tweet_id="2", text="World")]
+    fh = io.BytesIO()
+
+    write_tweets_html(fh, tweets, quoted_tweets=[], thread_context={})
+
+    html = fh.getvalue().decode()
+    assert html.startswith("<!DOCTYPE html>")
+    assert html.endswith("</html>\n")
+    tweets_match = re.search(r"const TWEETS = (\[.*?\]);", html)
+    facets_match = re.search(r"const FACETS = ({.*?});", html)
+    assert tweets_match is not None
+    assert facets_match is not None
+    assert [t["text"] for t in json.loads(tweets_match.group(1))] == ["Hello", "World"]
+    assert json.loads(facets_match.group(1))["media"]["text_only"] == 2
+    assert "raw_json" not in tweets_match.group(1)
+
+
+def test_write_tweets_html_references_embedded_thread_tweets_by_id(make_tweet: Any) -> None:
+    """Thread tweets that are already embedded are referenced by id only."""
+    tweet = make_tweet(tweet_id="1", conversation_id="1")
+    other = make_tweet(tweet_id="2", conversation_id="1")
+    fh = io.BytesIO()
+
+    write_tweets_html(fh, [tweet], quoted_tweets=[], thread_context={"1": [tweet, other]})
+
+    match = re.search(r"const THREAD_CONTEXT = (.*?);\n", fh.getvalue().decode())
+    assert match is not None
+    entries = json.loads(match.group(1))["1"]
+    assert entries[0] == "1"
+    assert entries[1]["id"] == "2"
+
+
+def test_author_list_scrolls_to_top_when_filter_changes() -> None:
+    """A changed author filter resets the virtualized list's scroll offset."""
+    viewer = (HTML_HEAD + HTML_TAIL).decode()
+
+    assert "let authorFilterText = '';" in viewer
+    assert "if (ft !== authorFilterText) {" in viewer
@@ -2,7 +2,9 @@
 
 from typing import Any
 
-from tweethoarder.export.json_export import export_tweets_to_json
+import pytest
+
+from tweethoarder.export.json_export import dumps_compact, export_tweets_to_json, loads_json
 
 
 def test_export_tweets_to_json_returns_dict() -> None:
@@ -83,3 +85,30 @@ def test_export_includes_quoted_tweet(make_tweet: Any) -> None:
     result = export_tweets_to_json(tweets=tweets, quoted_tweets={quoted_tweet["id"]: quoted_tweet})
     assert result["tweets"][0]["quoted_tweet"]["id"] == "999"
     assert result["tweets"][0]["quoted_tweet"]["text"] == "Original tweet"
+
+
+def test_export_stream_yields_formatted_tweets_lazily(make_tweet: Any) -> None:
+    """With stream=True the tweets are an iterator of the same formatted tweets."""
+    tweets = [make_tweet(tweet_id="1"), make_tweet(tweet_id="2")]
+    streamed = export_tweets_to_json(tweets, stream=True)
+    assert streamed["count"] == 2
+    assert not isinstance(streamed["tweets"], list)
+    assert list(streamed["tweets"]) == export_tweets_to_json(tweets)["tweets"]
+
+
+def test_dumps_compact_coerces_non_string_keys_like_stdlib() -> None:
+    """Compact JSON encoding should accept integer keys, matching the stdlib encoder."""
+    assert dumps_compact({2024: 3, "é": [1]}) == '{"2024":3,"é":[1]}'.encode()
+
+
+def test_loads_json_falls_back_to_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Parsing should give the same result and error type without orjson."""
+    import json
+    import sys
+
+    payload = '{"a": [1, "é"]}'
+    native = loads_json(payload)
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    assert loads_json(payload) == native == {"a": [1, "é"]}
+    with pytest.raises(json.JSONDecodeError):
+        loads_json("{not json")
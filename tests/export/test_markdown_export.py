@@ -1,8 +1,9 @@
 """Tests for Markdown export functionality."""
 
+import io
 from typing import Any
 
-from tweethoarder.export.markdown_export import export_tweets_to_markdown
+from tweethoarder.export.markdown_export import export_tweets_to_markdown, write_tweets_markdown
 
 
 def test_export_tweets_to_markdown_returns_string() -> None:
@@ -11,6 +12,15 @@ def test_export_tweets_to_markdown_returns_string() -> None:
     assert isinstance(result, str)
 
 
+def test_write_tweets_markdown_streams_same_document(make_tweet: Any) -> None:
+    """Streaming writer produces the same Markdown as the string export."""
+    tweets = [make_tweet(tweet_id="1", text="First"), make_tweet(tweet_id="2", text="Second")]
+    fh = io.StringIO()
+    write_tweets_markdown(tweets, fh, collection="likes")
+    expected = export_tweets_to_markdown(tweets, collection="likes")
+    assert fh.getvalue().splitlines()[2:] == expected.splitlines()[2:]
+
+
 def test_export_includes_collection_title() -> None:
     """Export includes collection name as title."""
     result = export_tweets_to_markdown(tweets=[], collection="likes")
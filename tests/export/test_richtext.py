@@ -6,6 +6,7 @@ from tweethoarder.export.richtext import (
     apply_richtext_tags_html,
     apply_richtext_tags_markdown,
     extract_richtext_tags,
+    richtext_tags_from_raw,
 )
 
 
@@ -164,3 +165,19 @@ class TestExtractRichtextTags:
         """Should return None for malformed JSON."""
         result = extract_richtext_tags("not valid json")
         assert result is None
+
+
+class TestRichtextTagsFromRaw:
+    """Tests for richtext_tags_from_raw function."""
+
+    def test_extracts_tags_from_parsed_payload(self) -> None:
+        """Tags should be read from an already parsed raw_json dict."""
+        tags = [{"from_index": 0, "to_index": 5, "richtext_types": ["Bold"]}]
+        raw = {
+            "note_tweet": {"note_tweet_results": {"result": {"richtext": {"richtext_tags": tags}}}}
+        }
+        assert richtext_tags_from_raw(raw) == tags
+
+    def test_returns_none_for_non_dict_payload(self) -> None:
+        """A payload that is not a JSON object has no tags."""
+        assert richtext_tags_from_raw(["not", "a", "tweet"]) is None
@@ -108,6 +108,26 @@ def test_extract_chrome_cookies_returns_unencrypted_values(tmp_path: Path) -> No
     assert cookies["twid"] == "test_twid_value"
 
 
+def test_extract_chrome_cookies_ignores_other_sites(tmp_path: Path) -> None:
+    """Should only read X/Twitter cookies, preferring x.com over twitter.com."""
+    from tweethoarder.auth.chrome import extract_chrome_cookies
+
+    db_path = tmp_path / "Cookies"
+    _create_test_chrome_cookies_db(
+        db_path,
+        [
+            ("auth_token", "x_auth_token", ".x.com"),
+            ("auth_token", "other_site_token", ".example.com"),
+            ("ct0", "legacy_ct0", ".twitter.com"),
+            ("ct0", "x_ct0", ".x.com"),
+        ],
+    )
+
+    cookies = extract_chrome_cookies(db_path)
+
+    assert cookies == {"auth_token": "x_auth_token", "ct0": "x_ct0"}
+
+
 def test_decrypt_chrome_cookie_is_importable() -> None:
     """decrypt_chrome_cookie function should be importable."""
     from tweethoarder.auth.chrome import decrypt_chrome_cookie
@@ -173,3 +193,52 @@ def test_get_chrome_encryption_key_returns_derived_key() -> None:
     # Key should be 16 bytes (AES-128)
     assert key is not None
     assert len(key) == 16
+
+
+def test_get_chrome_encryption_key_caches_keyring_lookup() -> None:
+    """Should only query the keyring once per process."""
+    from unittest.mock import MagicMock, patch
+
+    from tweethoarder.auth.chrome import clear_chrome_key_cache, get_chrome_encryption_key
+
+    clear_chrome_key_cache()
+    mock_item = MagicMock()
+    mock_item.get_secret.return_value = b"test_password"
+    mock_collection = MagicMock()
+    mock_collection.search_items.return_value = [mock_item]
+
+    with (
+        patch("secretstorage.dbus_init") as mock_dbus_init,
+        patch("secretstorage.get_default_collection", return_value=mock_collection),
+    ):
+        first = get_chrome_encryption_key()
+        second = get_chrome_encryption_key()
+
+    clear_chrome_key_cache()
+    assert first == second
+    mock_dbus_init.assert_called_once()
+
+
+def test_get_chrome_encryption_key_retries_after_missing_key() -> None:
+    """Should look again on the next call when the keyring had no Chrome item."""
+    from unittest.mock import MagicMock, patch
+
+    from tweethoarder.auth.chrome import clear_chrome_key_cache, get_chrome_encryption_key
+
+    clear_chrome_key_cache()
+    mock_item = MagicMock()
+    mock_item.get_secret.return_value = b"test_password"
+    mock_collection = MagicMock()
+    mock_collection.search_items.side_effect = [[], [mock_item]]
+
+    with (
+        patch("secretstorage.dbus_init"),
+        patch("secretstorage.get_default_collection", return_value=mock_collection),
+    ):
+        first = get_chrome_encryption_key()
+        second = get_chrome_encryption_key()
+
+    clear_chrome_key_cache()
+    assert first is None
+    assert second is not None
+    assert len(second) == 16
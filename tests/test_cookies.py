@@ -43,6 +43,33 @@ ct0 = "config_ct0"
     assert cookies["ct0"] == "config_ct0"
 
 
+def test_resolve_cookies_from_config_file_without_rtoml(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Should parse the config file with tomllib when rtoml is not installed."""
+    import sys
+
+    from tweethoarder.auth.cookies import resolve_cookies
+
+    monkeypatch.delenv("TWITTER_AUTH_TOKEN", raising=False)
+    monkeypatch.delenv("TWITTER_CT0", raising=False)
+    monkeypatch.setitem(sys.modules, "rtoml", None)
+
+    config_dir = tmp_path / "tweethoarder"
+    config_dir.mkdir(parents=True)
+    (config_dir / "config.toml").write_text("""
+[auth]
+auth_token = "config_auth_token"
+ct0 = "config_ct0"
+""")
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+    cookies = resolve_cookies()
+
+    assert cookies["auth_token"] == "config_auth_token"
+    assert cookies["ct0"] == "config_ct0"
+
+
 def _create_firefox_cookies_db(db_path: Path, cookies: list[tuple[str, str]]) -> None:
     """Create a test Firefox cookies database."""
     conn = sqlite3.connect(db_path)
@@ -82,6 +109,33 @@ def test_resolve_cookies_from_firefox(monkeypatch: MonkeyPatch, tmp_path: Path)
     assert cookies["ct0"] == "firefox_ct0"
 
 
+def test_resolve_cookies_caches_browser_lookup(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """Should reuse resolved browser cookies until the cache is cleared."""
+    import pytest
+
+    from tweethoarder.auth.cookies import CookieError, clear_cookie_cache, resolve_cookies
+
+    monkeypatch.delenv("TWITTER_AUTH_TOKEN", raising=False)
+    monkeypatch.delenv("TWITTER_CT0", raising=False)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "empty_config"))
+
+    firefox_dir = tmp_path / ".mozilla" / "firefox" / "test_profile"
+    firefox_dir.mkdir(parents=True)
+    cookies_db = firefox_dir / "cookies.sqlite"
+    _create_firefox_cookies_db(cookies_db, [("auth_token", "cached"), ("ct0", "cached_ct0")])
+
+    first = resolve_cookies(home_dir=tmp_path)
+    cookies_db.unlink()
+    second = resolve_cookies(home_dir=tmp_path)
+
+    assert second == first
+    assert second is not first
+
+    clear_cookie_cache()
+    with pytest.raises(CookieError):
+        resolve_cookies(home_dir=tmp_path)
+
+
 def test_resolve_cookies_raises_when_no_cookies_found(
     monkeypatch: MonkeyPatch, tmp_path: Path
 ) -> None:
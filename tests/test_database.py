@@ -3,6 +3,8 @@
 import sqlite3
 from pathlib import Path
 
+import pytest
+
 
 def _table_exists(db_path: Path, table_name: str) -> bool:
     """Check if a table exists in the database."""
@@ -697,6 +699,42 @@ def test_get_tweets_by_conversation_id_returns_matching_tweets(tmp_path: Path) -
     assert tweets[1]["id"] == "456"
 
 
+def test_get_tweets_by_conversation_ids_groups_by_conversation(tmp_path: Path) -> None:
+    """get_tweets_by_conversation_ids returns each conversation's tweets in order."""
+    from tweethoarder.storage.database import (
+        get_tweets_by_conversation_ids,
+        init_database,
+        save_tweet,
+    )
+
+    db_path = tmp_path / "test.db"
+    init_database(db_path)
+
+    for tweet_id, conversation_id, created_at in [
+        ("456", "123", "2025-01-01T12:01:00Z"),
+        ("123", "123", "2025-01-01T12:00:00Z"),
+        ("789", "789", "2025-01-01T12:02:00Z"),
+        ("999", "999", "2025-01-01T12:03:00Z"),
+    ]:
+        save_tweet(
+            db_path,
+            {
+                "id": tweet_id,
+                "text": f"Tweet {tweet_id}",
+                "author_id": "100",
+                "author_username": "user1",
+                "created_at": created_at,
+                "conversation_id": conversation_id,
+            },
+        )
+
+    conversations = get_tweets_by_conversation_ids(db_path, ["123", "789", "missing"])
+
+    assert set(conversations) == {"123", "789"}
+    assert [t["id"] for t in conversations["123"]] == ["123", "456"]
+    assert [t["id"] for t in conversations["789"]] == ["789"]
+
+
 def test_tweet_exists_returns_true_for_existing_tweet(tmp_path: Path) -> None:
     """tweet_exists should return True for tweets in database."""
     from tweethoarder.storage.database import init_database, save_tweet, tweet_exists
@@ -948,3 +986,109 @@ def test_tweet_in_collection_returns_false_for_different_collection(tmp_path: Pa
 
     # Tweet is in 'like' but not in 'bookmark'
     assert tweet_in_collection(db_path, "123", "bookmark") is False
+
+
+def test_get_tweets_by_ids_chunks_large_id_lists(tmp_path: Path) -> None:
+    """get_tweets_by_ids splits id lists longer than SQLITE_MAX_PARAMS into chunks."""
+    from tweethoarder.storage.database import (
+        SQLITE_MAX_PARAMS,
+        get_tweets_by_ids,
+        init_database,
+        save_tweet,
+    )
+
+    db_path = tmp_path / "test.db"
+    init_database(db_path)
+    for tweet_id in ("1", "2"):
+        save_tweet(
+            db_path,
+            {
+                "id": tweet_id,
+                "text": f"Tweet {tweet_id}",
+                "author_id": "100",
+                "author_username": "user1",
+                "created_at": "2025-01-01T12:00:00Z",
+            },
+        )
+
+    missing = [f"missing{i}" for i in range(SQLITE_MAX_PARAMS)]
+    tweets = get_tweets_by_ids(db_path, ["1", *missing, "2"])
+
+    assert sorted(t["id"] for t in tweets) == ["1", "2"]
+
+
+def test_open_db_shares_connection_with_read_helpers(tmp_path: Path) -> None:
+    """Read helpers called inside open_db run on the shared connection."""
+    from tweethoarder.storage.database import (
+        get_tweets_by_ids,
+        init_database,
+        open_db,
+        save_tweet,
+    )
+
+    db_path = tmp_path / "test.db"
+    init_database(db_path)
+    save_tweet(
+        db_path,
+        {
+            "id": "123",
+            "text": "Shared connection tweet",
+            "author_id": "100",
+            "author_username": "user1",
+            "created_at": "2025-01-01T12:00:00Z",
+        },
+    )
+
+    statements: list[str] = []
+    with open_db(db_path) as conn:
+        conn.set_trace_callback(statements.append)
+        tweets = get_tweets_by_ids(db_path, ["123"])
+
+    assert [t["text"] for t in tweets] == ["Shared connection tweet"]
+    assert any("WHERE id IN" in sql for sql in statements)
+    # Outside the block the helpers open their own connection again
+    assert get_tweets_by_ids(db_path, ["123"])[0]["id"] == "123"
+
+
+def test_open_db_nested_block_keeps_outer_connection(tmp_path: Path) -> None:
+    """A nested open_db reuses the outer connection and leaves it shared on exit."""
+    from tweethoarder.storage.database import (
+        get_tweets_by_ids,
+        init_database,
+        open_db,
+        save_tweet,
+    )
+
+    db_path = tmp_path / "test.db"
+    init_database(db_path)
+    save_tweet(
+        db_path,
+        {
+            "id": "123",
+            "text": "Nested tweet",
+            "author_id": "100",
+            "author_username": "user1",
+            "created_at": "2025-01-01T12:00:00Z",
+        },
+    )
+
+    statements: list[str] = []
+    with open_db(db_path) as outer:
+        with open_db(db_path) as inner:
+            assert inner is outer
+        outer.set_trace_callback(statements.append)
+        tweets = get_tweets_by_ids(db_path, ["123"])
+
+    assert [t["text"] for t in tweets] == ["Nested tweet"]
+    assert any("WHERE id IN" in sql for sql in statements)
+
+
+def test_open_db_connection_is_read_only(tmp_path: Path) -> None:
+    """The open_db connection rejects writes."""
+    from tweethoarder.storage.database import init_database, open_db
+
+    db_path = tmp_path / "test.db"
+    init_database(db_path)
+
+    with open_db(db_path) as conn, pytest.raises(sqlite3.OperationalError, match="readonly"):
+        conn.execute("DELETE FROM tweets")
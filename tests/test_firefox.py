@@ -2,6 +2,9 @@
 
 import sqlite3
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 
 def _create_test_cookies_db(db_path: Path, cookies: list[tuple[str, str, str]]) -> None:
@@ -51,6 +54,27 @@ def test_extract_firefox_cookies_returns_auth_token_and_ct0(tmp_path: Path) -> N
     assert cookies["ct0"] == "test_ct0_value"
 
 
+def test_extract_firefox_cookies_reads_database_locked_by_browser(tmp_path: Path) -> None:
+    """Should still read cookies while the browser holds an exclusive lock."""
+    from tweethoarder.auth.firefox import extract_firefox_cookies
+
+    db_path = tmp_path / "cookies.sqlite"
+    _create_test_cookies_db(
+        db_path,
+        [("auth_token", "locked_auth_token", ".x.com"), ("ct0", "locked_ct0", ".x.com")],
+    )
+
+    browser = sqlite3.connect(db_path)
+    browser.execute("BEGIN EXCLUSIVE")
+    try:
+        cookies = extract_firefox_cookies(db_path)
+    finally:
+        browser.rollback()
+        browser.close()
+
+    assert cookies == {"auth_token": "locked_auth_token", "ct0": "locked_ct0"}
+
+
 def test_find_firefox_cookies_db_returns_most_recent(tmp_path: Path) -> None:
     """Should find the most recently modified cookies.sqlite across locations."""
     from tweethoarder.auth.firefox import find_firefox_cookies_db
@@ -84,3 +108,62 @@ def test_find_firefox_cookies_db_returns_none_when_no_firefox(tmp_path: Path) ->
     result = find_firefox_cookies_db(tmp_path)
 
     assert result is None
+
+
+def test_find_firefox_cookies_db_skips_deleted_profile(tmp_path: Path) -> None:
+    """Should ignore a cached profile whose cookies.sqlite has since been removed."""
+    from tweethoarder.auth.firefox import find_firefox_cookies_db
+
+    profile_dir = tmp_path / ".mozilla" / "firefox" / "profile1"
+    profile_dir.mkdir(parents=True)
+    db_path = profile_dir / "cookies.sqlite"
+    _create_test_cookies_db(db_path, [("auth_token", "value", ".x.com")])
+
+    assert find_firefox_cookies_db(tmp_path) == db_path
+
+    db_path.unlink()
+
+    assert find_firefox_cookies_db(tmp_path) is None
+
+
+def test_find_firefox_cookies_db_ignores_profiles_without_cookies(tmp_path: Path) -> None:
+    """Should skip profile directories that have no cookies.sqlite."""
+    from tweethoarder.auth.firefox import find_firefox_cookies_db
+
+    firefox_dir = tmp_path / ".mozilla" / "firefox"
+    (firefox_dir / "empty_profile").mkdir(parents=True)
+    (firefox_dir / "profiles.ini").write_text("[General]\n")
+    profile_dir = firefox_dir / "profile1"
+    profile_dir.mkdir()
+    db_path = profile_dir / "cookies.sqlite"
+    _create_test_cookies_db(db_path, [("auth_token", "value", ".x.com")])
+
+    assert find_firefox_cookies_db(tmp_path) == db_path
+
+
+def test_find_firefox_cookies_db_skips_unreadable_firefox_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Should skip a Firefox directory it can't list and keep searching the others."""
+    import os
+
+    from tweethoarder.auth import firefox
+    from tweethoarder.auth.firefox import find_firefox_cookies_db
+
+    unreadable_dir = tmp_path / ".mozilla" / "firefox"
+    (unreadable_dir / "profile1").mkdir(parents=True)
+    profile_dir = tmp_path / "snap" / "firefox" / "common" / ".mozilla" / "firefox" / "profile2"
+    profile_dir.mkdir(parents=True)
+    db_path = profile_dir / "cookies.sqlite"
+    _create_test_cookies_db(db_path, [("auth_token", "value", ".x.com")])
+
+    real_scandir = os.scandir
+
+    def scandir(path: Path) -> Any:
+        if Path(path) == unreadable_dir:
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(firefox.os, "scandir", scandir)
+
+    assert find_firefox_cookies_db(tmp_path) == db_path